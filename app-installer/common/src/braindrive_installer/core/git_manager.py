@@ -11,6 +11,9 @@ from typing import Optional, Tuple, Dict, Any
 from braindrive_installer.core.platform_utils import PlatformUtils
 from braindrive_installer.core.installer_logger import get_installer_logger
 
+# Console-hiding flags are fixed per platform; resolve them once
+_NO_WINDOW_FLAGS = PlatformUtils.create_no_window_flags()
+
 
 class GitManager:
     """Manages Git repository operations for BrainDrive installation."""
@@ -49,9 +52,6 @@ class GitManager:
             if command[0] != 'git':
                 command.insert(0, 'git')
             
-            # Get platform-specific process creation flags
-            flags_dict = PlatformUtils.create_no_window_flags()
-            
             # Prepare subprocess arguments
             subprocess_args = {
                 'cwd': cwd,
@@ -60,10 +60,8 @@ class GitManager:
                 'timeout': 300  # 5 minute timeout
             }
             
-            # Add platform-specific flags
-            if PlatformUtils.get_os_type() == 'windows':
-                subprocess_args['creationflags'] = flags_dict.get('creationflags', 0)
-                subprocess_args['startupinfo'] = flags_dict.get('startupinfo')
+            # Add platform-specific flags (empty outside Windows)
+            subprocess_args.update(_NO_WINDOW_FLAGS)
             
             result = subprocess.run(command, **subprocess_args)
             
@@ -99,7 +97,7 @@ class GitManager:
             return False, error_msg
     
     def clone_repository(self, repo_url: str, target_path: str,
-                        branch: str = "main") -> Tuple[bool, str]:
+                        branch: str = "main", shallow: bool = False) -> Tuple[bool, str]:
         """
         Clone a Git repository with progress tracking.
         
@@ -107,6 +105,9 @@ class GitManager:
             repo_url: URL of the repository to clone
             target_path: Local path where repository should be cloned
             branch: Branch to clone (default: main)
+            shallow: Fetch only the latest commit of the branch. Pulls still work,
+                but history-based helpers (get_commit_count) see one commit until
+                `git fetch --unshallow` is run
             
         Returns:
             Tuple of (success, error_message_if_failed)
@@ -138,7 +139,10 @@ class GitManager:
             os.makedirs(parent_dir, exist_ok=True)
         
         # Clone the repository
-        clone_command = ['clone', '--progress', '--branch', branch, repo_url, target_path]
+        clone_command = ['clone', '--progress', '--branch', branch]
+        if shallow:
+            clone_command += ['--depth', '1', '--single-branch']
+        clone_command += [repo_url, target_path]
         self.logger.info(f"Executing git command: {' '.join(clone_command)}")
         success, stdout, stderr = self._run_git_command(clone_command)
         
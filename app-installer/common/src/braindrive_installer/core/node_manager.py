@@ -11,6 +11,11 @@ from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, List
 from braindrive_installer.core.platform_utils import PlatformUtils
 
+# Platform facts don't change while the installer runs; resolve them once
+_IS_WINDOWS = PlatformUtils.get_os_type() == 'windows'
+_NO_WINDOW_FLAGS = PlatformUtils.create_no_window_flags()
+_NPM_EXE = PlatformUtils.get_npm_executable_name()
+
 
 class NodeManager:
     """Manages Node.js and npm operations for BrainDrive installation."""
@@ -46,12 +51,9 @@ class NodeManager:
             Tuple of (success, stdout, stderr)
         """
         try:
-            # Get platform-specific process creation flags
-            flags_dict = PlatformUtils.create_no_window_flags()
-            
             # Add platform-specific executable extensions if needed
             if command[0] in ['npm', 'node', 'npx']:
-                if PlatformUtils.get_os_type() == 'windows':
+                if _IS_WINDOWS:
                     command[0] += '.cmd'
             
             # Prepare subprocess arguments
@@ -62,10 +64,8 @@ class NodeManager:
                 'timeout': timeout
             }
             
-            # Add platform-specific flags
-            if PlatformUtils.get_os_type() == 'windows':
-                subprocess_args['creationflags'] = flags_dict.get('creationflags', 0)
-                subprocess_args['startupinfo'] = flags_dict.get('startupinfo')
+            # Add platform-specific flags (empty outside Windows)
+            subprocess_args.update(_NO_WINDOW_FLAGS)
             
             result = subprocess.run(command, **subprocess_args)
             
@@ -252,13 +252,8 @@ class NodeManager:
             return False, None, error_msg
         
         try:
-            # Get platform-specific process creation flags
-            flags_dict = PlatformUtils.create_no_window_flags()
-            
             # Prepare command
-            dev_command = ['npm', 'run', script_name]
-            if PlatformUtils.get_os_type() == 'windows':
-                dev_command[0] = 'npm.cmd'
+            dev_command = [_NPM_EXE, 'run', script_name]
             
             # Prepare subprocess arguments
             popen_args = {
@@ -269,9 +264,8 @@ class NodeManager:
             }
             
             # Add platform-specific flags
-            if PlatformUtils.get_os_type() == 'windows':
-                popen_args['creationflags'] = flags_dict.get('creationflags', 0)
-                popen_args['startupinfo'] = flags_dict.get('startupinfo')
+            if _IS_WINDOWS:
+                popen_args.update(_NO_WINDOW_FLAGS)
             else:
                 # On Unix, start a new session so we can kill the whole group on Stop
                 popen_args['start_new_session'] = True
@@ -305,9 +299,10 @@ class NodeManager:
         if not os.path.isdir(node_modules_path):
             return False
         
-        # Check if directory has content
+        # Check if directory has content; stop reading after the first entry
         try:
-            return len(os.listdir(node_modules_path)) > 0
+            with os.scandir(node_modules_path) as it:
+                return next(it, None) is not None
         except OSError:
             return False
     
@@ -6,11 +6,25 @@ Handles plugin discovery and building automation for BrainDrive plugins.
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any, List
 from braindrive_installer.core.node_manager import NodeManager
 from braindrive_installer.core.installer_logger import get_installer_logger
 
+# Build output directories checked by check_plugin_built, in reporting order
+_COMMON_BUILD_DIRS = ("dist", "build", "lib", "out")
+_COMMON_BUILD_SET = frozenset(_COMMON_BUILD_DIRS)
+
+# Upper bound on concurrent plugin builds; each runs its own npm install and build
+_MAX_PARALLEL_BUILDS = 4
+
+
+def _has_any_entry(path: str) -> bool:
+    """Return True if the directory has at least one entry, stopping at the first."""
+    with os.scandir(path) as it:
+        return next(it, None) is not None
+
 
 class PluginBuilder:
     """Manages plugin building automation for BrainDrive installation."""
@@ -34,10 +48,14 @@ class PluginBuilder:
             self.status_updater.update_status(message, "", progress or 0)
         self.logger.info(message)
     
-    def discover_plugins(self) -> Tuple[bool, List[Dict[str, Any]]]:
+    def discover_plugins(self, include_build_status: bool = False) -> Tuple[bool, List[Dict[str, Any]]]:
         """
         Find all plugin directories with package.json files.
         
+        Args:
+            include_build_status: Also record "is_built" and "build_info" for
+                each plugin during the same scan
+        
         Returns:
             Tuple of (success, list_of_plugin_info)
         """
@@ -56,9 +74,12 @@ class PluginBuilder:
         plugins = []
         
         try:
+            # Join the separator once; entries are appended with plain concatenation
+            prefix = os.path.join(self.plugins_path, "")
+
             # Scan for plugin directories
             for item in os.listdir(self.plugins_path):
-                item_path = os.path.join(self.plugins_path, item)
+                item_path = prefix + item
                 
                 # Skip files, only process directories
                 if not os.path.isdir(item_path):
@@ -79,8 +100,10 @@ class PluginBuilder:
                         "has_dev_script": "dev" in package_info.get("scripts", {}),
                         "package_json_path": package_info.get("path")
                     }
+                    if include_build_status:
+                        plugin_info["is_built"], plugin_info["build_info"] = self.check_plugin_built(item_path)
                     plugins.append(plugin_info)
-                    self.logger.debug(f"Found plugin: {plugin_info['name']} at {item_path}")
+                    self.logger.debug("Found plugin: %s at %s", plugin_info['name'], item_path)
             
             self._update_status(f"Discovered {len(plugins)} plugins")
             return True, plugins
@@ -111,12 +134,21 @@ class PluginBuilder:
         if self.node_manager.check_node_modules_exists(plugin_path):
             build_info["has_node_modules"] = True
         
-        # Check for common build output directories
-        common_build_dirs = ["dist", "build", "lib", "out"]
-        for build_dir in common_build_dirs:
-            build_dir_path = os.path.join(plugin_path, build_dir)
-            if os.path.exists(build_dir_path) and os.path.isdir(build_dir_path):
-                if os.listdir(build_dir_path):  # Directory is not empty
+        # Check for common build output directories with a single scan of the plugin root
+        try:
+            with os.scandir(plugin_path) as it:
+                present = {
+                    entry.name for entry in it if entry.is_dir(follow_symlinks=False)
+                } & _COMMON_BUILD_SET
+        except OSError:
+            present = set()
+        
+        if present:
+            plugin_prefix = os.path.join(plugin_path, "")
+            for build_dir in _COMMON_BUILD_DIRS:
+                if build_dir not in present:
+                    continue
+                if _has_any_entry(plugin_prefix + build_dir):  # Directory is not empty
                     build_info["build_artifacts"].append(build_dir)
                     if build_dir == "dist":
                         build_info["has_dist"] = True
@@ -128,23 +160,27 @@ class PluginBuilder:
         
         return is_built, build_info
     
-    def build_plugin(self, plugin_path: str, force_clean: bool = False) -> Tuple[bool, str]:
+    def build_plugin(self, plugin_path: str, force_clean: bool = False,
+                     package_info: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
         """
         Build an individual plugin.
         
         Args:
             plugin_path: Path to the plugin directory
             force_clean: Whether to clean node_modules before building
+            package_info: Already-parsed package.json data (name, scripts);
+                read from disk when omitted
             
         Returns:
             Tuple of (success, error_message_if_failed)
         """
         # Get plugin name for logging
-        exists, package_info = self.node_manager.check_package_json_exists(plugin_path)
-        if not exists:
-            error_msg = f"Cannot build plugin: {package_info.get('error', 'Unknown error')}"
-            self._update_status(error_msg)
-            return False, error_msg
+        if package_info is None:
+            exists, package_info = self.node_manager.check_package_json_exists(plugin_path)
+            if not exists:
+                error_msg = f"Cannot build plugin: {package_info.get('error', 'Unknown error')}"
+                self._update_status(error_msg)
+                return False, error_msg
         
         plugin_name = package_info.get("name", os.path.basename(plugin_path))
         self._update_status(f"Building plugin: {plugin_name}")
@@ -187,13 +223,16 @@ class PluginBuilder:
             return False, error_msg
     
     def build_all_plugins(self, force_clean: bool = False, 
-                         skip_built: bool = True) -> Tuple[bool, Dict[str, Any]]:
+                         skip_built: bool = True,
+                         parallel: bool = False) -> Tuple[bool, Dict[str, Any]]:
         """
         Build all discovered plugins.
         
         Args:
             force_clean: Whether to clean node_modules before building
             skip_built: Whether to skip plugins that are already built
+            parallel: Whether to build several plugins at once (each plugin
+                builds in its own directory)
             
         Returns:
             Tuple of (overall_success, build_results)
@@ -201,7 +240,7 @@ class PluginBuilder:
         self._update_status("Starting batch plugin build...")
         
         # Discover plugins
-        success, plugins = self.discover_plugins()
+        success, plugins = self.discover_plugins(include_build_status=skip_built)
         if not success:
             return False, {"error": "Failed to discover plugins"}
         
@@ -218,39 +257,61 @@ class PluginBuilder:
             "failed_plugins": []
         }
         
+        # Bind per-iteration lookups once; the loop body runs for every plugin
+        update = self._update_status
+        build_one = self.build_plugin
+        details = build_results["build_details"]
+        failed_plugins = build_results["failed_plugins"]
+        n = len(plugins)
+        inv_n = 100.0 / n
+        
+        to_build = []
         for i, plugin in enumerate(plugins):
             plugin_name = plugin["name"]
-            plugin_path = plugin["path"]
             
-            progress = int((i / len(plugins)) * 100)
-            self._update_status(f"Processing plugin {i+1}/{len(plugins)}: {plugin_name}", progress)
+            progress = int(i * inv_n)
+            update(f"Processing plugin {i+1}/{n}: {plugin_name}", progress)
             
             # Check if plugin is already built and skip if requested
-            if skip_built:
-                is_built, build_info = self.check_plugin_built(plugin_path)
-                if is_built:
-                    self._update_status(f"Plugin {plugin_name} is already built, skipping")
-                    build_results["plugins_skipped"] += 1
-                    build_results["build_details"][plugin_name] = {
-                        "status": "skipped",
-                        "reason": "already_built",
-                        "build_info": build_info
-                    }
-                    continue
+            if skip_built and plugin["is_built"]:
+                update(f"Plugin {plugin_name} is already built, skipping")
+                build_results["plugins_skipped"] += 1
+                details[plugin_name] = {
+                    "status": "skipped",
+                    "reason": "already_built",
+                    "build_info": plugin["build_info"]
+                }
+                continue
             
-            # Build the plugin
-            success, error_msg = self.build_plugin(plugin_path, force_clean)
+            to_build.append(plugin)
+        
+        def _build(plugin):
+            package_info = {"name": plugin["name"], "scripts": plugin["scripts"]}
+            return build_one(plugin["path"], force_clean, package_info)
+        
+        workers = min(_MAX_PARALLEL_BUILDS, os.cpu_count() or 1, len(to_build)) if parallel else 1
+        if workers > 1:
+            # npm installs and builds are subprocess bound; results arrive in completion order
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_build, plugin): plugin for plugin in to_build}
+                outcomes = [(futures[future], future.result()) for future in as_completed(futures)]
+        else:
+            outcomes = ((plugin, _build(plugin)) for plugin in to_build)
+        
+        for plugin, (success, error_msg) in outcomes:
+            plugin_name = plugin["name"]
+            plugin_path = plugin["path"]
             
             if success:
                 build_results["plugins_built"] += 1
-                build_results["build_details"][plugin_name] = {
+                details[plugin_name] = {
                     "status": "success",
                     "path": plugin_path
                 }
             else:
                 build_results["plugins_failed"] += 1
-                build_results["failed_plugins"].append(plugin_name)
-                build_results["build_details"][plugin_name] = {
+                failed_plugins.append(plugin_name)
+                details[plugin_name] = {
                     "status": "failed",
                     "error": error_msg,
                     "path": plugin_path
@@ -6,30 +6,136 @@ Handles dual server process management for backend and frontend services.
 import os
 import subprocess
 import psutil
+import re
 import time
 import logging
+import shlex
+import shutil
 import signal
-from typing import Optional, Tuple, Dict, Any, List
+import socket
+from typing import Callable, Optional, Tuple, Dict, Any, List
+from braindrive_installer.core.installer_logger import get_log_file_path
 from braindrive_installer.core.platform_utils import PlatformUtils
 from braindrive_installer.core.port_selector import DEFAULT_PORT_PAIRS
 
 MANAGED_BACKEND_PORTS = tuple(pair[0] for pair in DEFAULT_PORT_PAIRS)
 MANAGED_FRONTEND_PORTS = tuple(pair[1] for pair in DEFAULT_PORT_PAIRS)
 
+# Platform facts don't change while the installer runs; resolve them once
+_IS_WINDOWS = PlatformUtils.get_os_type() == 'windows'
+_NO_WINDOW_FLAGS = PlatformUtils.create_no_window_flags()
+_CTRL_BREAK = getattr(signal, 'CTRL_BREAK_EVENT', None)
+
+# Executable name prefixes (lowercase) of processes that can be BrainDrive servers
+_ADOPTION_NAME_PREFIXES = ('python', 'uvicorn', 'node', 'npm')
+
+# (process name, label, command line tokens that must all appear, ports it may listen on)
+_ADOPTION_RULES = (
+    ('braindrive_backend', 'backend', ('uvicorn', 'main:app'), MANAGED_BACKEND_PORTS),
+    ('braindrive_frontend', 'frontend', ('npm', 'run', 'dev'), MANAGED_FRONTEND_PORTS),
+)
+
+# Snapshot of os.environ used as the base for per-process overrides (see refresh_base_env)
+_BASE_ENV: Optional[Dict[str, str]] = None
+
+
+def _get_base_env() -> Dict[str, str]:
+    """Return the cached environment snapshot, taking it on first use."""
+    global _BASE_ENV
+    if _BASE_ENV is None:
+        _BASE_ENV = dict(os.environ)
+    return _BASE_ENV
+
+
+# (executable name, PATH) -> resolved path, kept for the life of the installer
+_WHICH_CACHE: Dict[Tuple[str, Optional[str]], Optional[str]] = {}
+
+
+def _resolve_executable(command: List[str], env: Optional[Dict[str, str]] = None) -> List[str]:
+    """Return command with a bare argv[0] resolved against PATH, caching the lookup."""
+    program = command[0] if command else ""
+    # Windows picks .exe over .cmd/.bat differently from shutil.which; leave it to CreateProcess
+    if _IS_WINDOWS or not program or os.path.dirname(program):
+        return command
+    # Popen searches the child's PATH, which an override may replace
+    search_path = env['PATH'] if env and 'PATH' in env else _get_base_env().get('PATH')
+    key = (program, search_path)
+    if key not in _WHICH_CACHE:
+        _WHICH_CACHE[key] = shutil.which(program, path=search_path)
+    resolved = _WHICH_CACHE[key]
+    return [resolved, *command[1:]] if resolved else command
+
+
+def refresh_base_env() -> None:
+    """Re-snapshot os.environ; call after changing it so new processes see the change."""
+    global _BASE_ENV
+    _BASE_ENV = dict(os.environ)
+
+
+class _AdoptedProcess:
+    """Popen-like wrapper around a psutil handle for a process we did not spawn."""
+    
+    __slots__ = ("pid", "_ps", "returncode")
+    
+    def __init__(self, ps_process: psutil.Process):
+        self.pid = ps_process.pid
+        self._ps = ps_process
+        self.returncode = None
+    
+    def poll(self) -> Optional[int]:
+        """Return None while running, otherwise the exit code (0 when unknown)."""
+        if self.returncode is not None:
+            return self.returncode
+        try:
+            if self._ps.is_running():
+                return None
+            exit_code = self._ps.wait(0)
+        except psutil.TimeoutExpired:
+            return None
+        except psutil.NoSuchProcess:
+            exit_code = None
+        self.returncode = 0 if exit_code is None else exit_code
+        return self.returncode
+    
+    def send_signal(self, sig):
+        self._ps.send_signal(sig)
+    
+    def terminate(self):
+        self._ps.terminate()
+    
+    def kill(self):
+        self._ps.kill()
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        try:
+            exit_code = self._ps.wait(timeout)
+        except psutil.TimeoutExpired:
+            raise subprocess.TimeoutExpired(f"pid {self.pid}", timeout)
+        self.returncode = 0 if exit_code is None else exit_code
+        return self.returncode
+
+
+def compile_patterns(patterns) -> "re.Pattern":
+    """Compile literal command line patterns into one alternation for kill_processes_by_patterns."""
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns))
+
 
 class ProcessManager:
     """Manages dual server processes for BrainDrive installation."""
     
-    def __init__(self, status_updater=None):
+    def __init__(self, status_updater=None, log_dir: Optional[str] = None):
         """
         Initialize Process Manager.
         
         Args:
             status_updater: Optional status updater for progress tracking
+            log_dir: Directory for per-process stdout/stderr logs
+                (defaults to the installer log directory)
         """
         self.status_updater = status_updater
         self.logger = logging.getLogger(__name__)
         self.processes = {}  # Dictionary to track named processes
+        self.log_dir = log_dir
         
     def _update_status(self, message: str, progress: Optional[int] = None):
         """Update status if status_updater is available."""
@@ -46,7 +152,7 @@ class ProcessManager:
             return
         
         process = info.get("process")
-        command_str = info.get("command_str") or " ".join(info.get("command", []))
+        command_str = info["command_str"]
         cwd_display = info.get("cwd") or os.getcwd()
         pid = info.get("pid")
         return_code = process.poll() if process else None
@@ -56,27 +162,55 @@ class ProcessManager:
             name, pid, return_code, command_str, cwd_display
         )
         
-        if include_output and process:
-            if return_code is not None and not info.get("captured_output"):
-                try:
-                    stdout_data, stderr_data = process.communicate(timeout=1)
-                except Exception as exc:
-                    stdout_data, stderr_data = "", f"<failed to capture stderr: {exc}>"
-                info["captured_output"] = True
-                info["stdout"] = stdout_data
-                info["stderr"] = stderr_data
-            
-            stdout_snapshot = info.get("stdout")
-            stderr_snapshot = info.get("stderr")
+        if include_output:
+            stdout_snapshot = self._read_log_tail(info.get("stdout_path"))
+            stderr_snapshot = self._read_log_tail(info.get("stderr_path"))
             if stdout_snapshot:
                 target_logger.error("Process '%s' stdout:%s%s", name, os.linesep, stdout_snapshot.strip())
             if stderr_snapshot:
                 target_logger.error("Process '%s' stderr:%s%s", name, os.linesep, stderr_snapshot.strip())
     
+    def _get_log_dir(self) -> str:
+        """Resolve (and create) the directory that holds process output logs."""
+        if self.log_dir is None:
+            self.log_dir = os.path.join(os.path.dirname(get_log_file_path()), "processes")
+        os.makedirs(self.log_dir, exist_ok=True)
+        return self.log_dir
+    
+    @staticmethod
+    def _read_log_tail(path: Optional[str], lines: int = 50) -> str:
+        """
+        Read the last lines of a process log file without loading the whole file.
+        
+        Args:
+            path: Log file path (may be None for processes without logs)
+            lines: Number of trailing lines to return
+            
+        Returns:
+            The trailing lines joined with newlines, or "" if unavailable
+        """
+        if not path:
+            return ""
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                window = min(lines * 256, size)
+                f.seek(size - window)
+                # Bounded read: the process may still be appending to the file
+                data = f.read(window)
+        except OSError:
+            return ""
+        tail = data.decode("utf-8", errors="replace").splitlines()
+        if window < size:
+            tail = tail[1:]  # First line is probably cut off by the seek
+        return "\n".join(tail[-lines:])
+    
     def start_process(self, name: str, command: List[str], cwd: Optional[str] = None, 
                      env: Optional[Dict[str, str]] = None, 
                      wait_for_startup: bool = False,
-                     startup_timeout: int = 30) -> Tuple[bool, str]:
+                     startup_timeout: int = 30,
+                     readiness_port: Optional[int] = None,
+                     readiness_check: Optional[Callable[[], bool]] = None) -> Tuple[bool, str]:
         """
         Start and track a named process.
         
@@ -87,11 +221,14 @@ class ProcessManager:
             env: Environment variables for the process
             wait_for_startup: Whether to wait for process to be ready
             startup_timeout: Timeout in seconds for startup wait
+            readiness_port: Local port the process listens on once it is ready
+            readiness_check: Callable returning True once the process is ready
             
         Returns:
             Tuple of (success, error_message_if_failed)
         """
-        command_str = " ".join(command)
+        command = _resolve_executable(command, env)
+        command_str = shlex.join(command)
         cwd_display = cwd or os.getcwd()
         self._update_status(f"Starting process '{name}'...")
         self._update_status(f" • Command: {command_str}")
@@ -107,43 +244,54 @@ class ProcessManager:
                 del self.processes[name]
         
         try:
-            # Get platform-specific process creation flags
-            flags_dict = PlatformUtils.create_no_window_flags()
+            # Prepare environment; with no overrides the child simply inherits ours
+            process_env = {**_get_base_env(), **env} if env else None
             
-            # Prepare environment
-            process_env = os.environ.copy()
-            if env:
-                process_env.update(env)
+            # Send output to log files; undrained pipes would block a chatty server
+            log_dir = self._get_log_dir()
+            stdout_path = os.path.join(log_dir, f"{name}.stdout.log")
+            stderr_path = os.path.join(log_dir, f"{name}.stderr.log")
             
             # Prepare subprocess arguments
             popen_args = {
                 'cwd': cwd,
                 'env': process_env,
-                'stdout': subprocess.PIPE,
-                'stderr': subprocess.PIPE,
-                'text': True
             }
             
             # Add platform-specific flags
-            if PlatformUtils.get_os_type() == 'windows':
-                popen_args['creationflags'] = flags_dict.get('creationflags', 0)
-                popen_args['startupinfo'] = flags_dict.get('startupinfo')
+            if _IS_WINDOWS:
+                popen_args['creationflags'] = _NO_WINDOW_FLAGS.get('creationflags', 0)
+                popen_args['startupinfo'] = _NO_WINDOW_FLAGS.get('startupinfo')
+            else:
+                # Lead a new process group so the whole tree can be signalled at once
+                popen_args['start_new_session'] = True
+            
+            # Start the process; the child keeps its own copies of the log handles
+            with open(stdout_path, "wb", buffering=0) as stdout_file, \
+                    open(stderr_path, "wb", buffering=0) as stderr_file:
+                process = subprocess.Popen(command, stdout=stdout_file, stderr=stderr_file, **popen_args)
             
-            # Start the process
-            process = subprocess.Popen(command, **popen_args)
+            # Keep a psutil handle so status queries don't rebuild it on every call
+            try:
+                ps_process = psutil.Process(process.pid)
+            except psutil.Error:
+                ps_process = None
             
             # Store process information
             self.processes[name] = {
                 "process": process,
+                "ps_process": ps_process,
                 "command": command,
                 "command_str": command_str,
                 "cwd": cwd,
                 "env": env,
+                "readiness_port": readiness_port,
+                "readiness_check": readiness_check,
                 "start_time": time.time(),
                 "pid": process.pid,
-                "captured_output": False,
-                "stdout": "",
-                "stderr": ""
+                "pgid": None if _IS_WINDOWS else process.pid,
+                "stdout_path": stdout_path,
+                "stderr_path": stderr_path
             }
             
             self._update_status(f"Process '{name}' started with PID {process.pid}")
@@ -164,6 +312,141 @@ class ProcessManager:
             self._update_status(error_msg)
             return False, error_msg
     
+    def _collect_process_tree(self, process_info: Dict[str, Any]) -> List[psutil.Process]:
+        """Return the tracked process and all of its descendants as psutil handles."""
+        try:
+            parent_process = process_info.get("ps_process") or psutil.Process(process_info["pid"])
+            return [parent_process] + parent_process.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return []
+    
+    def _terminate_process_trees(self, procs: List[psutil.Process],
+                                 graceful_timeout: int) -> Tuple[List[psutil.Process], List[psutil.Process]]:
+        """
+        Terminate a set of processes and wait for them together, force killing holdouts.
+        
+        Args:
+            procs: psutil handles to stop (parents and descendants)
+            graceful_timeout: Shared timeout in seconds for graceful shutdown
+            
+        Returns:
+            Tuple of (gone, alive) process lists
+        """
+        for proc in procs:
+            try:
+                proc.terminate()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue  # Process already dead or no access
+        
+        gone, alive = psutil.wait_procs(procs, timeout=graceful_timeout)
+        if not alive:
+            return gone, alive
+        
+        self._update_status(f"Graceful shutdown timed out, force killing {len(alive)} processes...")
+        for proc in alive:
+            try:
+                proc.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        
+        killed, alive = psutil.wait_procs(alive, timeout=5)
+        return gone + killed, alive
+    
+    @staticmethod
+    def _signal_process_group(pgid: int, sig) -> None:
+        """Send a signal to every process in a POSIX process group."""
+        try:
+            os.killpg(pgid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass  # Group already gone, or nothing left we may signal
+    
+    @staticmethod
+    def _process_group_alive(pgid: int) -> bool:
+        """Return True while any process in the POSIX process group exists."""
+        try:
+            os.killpg(pgid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+    
+    def _finish_process_groups(self, leaders: Dict[int, Any], graceful_timeout: float) -> List[int]:
+        """
+        Wait for already-signalled process groups to exit, force killing holdouts.
+        
+        Args:
+            leaders: Mapping of pgid to the Popen object of the group leader
+            graceful_timeout: Timeout in seconds for graceful shutdown
+            
+        Returns:
+            List of pgids that still have live members
+        """
+        def wait_for(pgids: List[int], timeout: float) -> List[int]:
+            def all_gone() -> bool:
+                for pgid in pgids:
+                    leaders[pgid].poll()  # Reap the leader so it doesn't linger as a zombie
+                return not any(self._process_group_alive(pgid) for pgid in pgids)
+            
+            self._poll_with_backoff(all_gone, timeout)
+            return [pgid for pgid in pgids if self._process_group_alive(pgid)]
+        
+        alive = wait_for(list(leaders), graceful_timeout)
+        if not alive:
+            return alive
+        
+        self._update_status(f"Graceful shutdown timed out, force killing {len(alive)} process groups...")
+        for pgid in alive:
+            self._signal_process_group(pgid, signal.SIGKILL)
+        return wait_for(alive, 5)
+    
+    @staticmethod
+    def _signal_popen_process(process) -> bool:
+        """Ask a process to stop through its Popen object; returns False if it is already gone."""
+        try:
+            if _IS_WINDOWS and _CTRL_BREAK is not None:
+                try:
+                    process.send_signal(_CTRL_BREAK)
+                except:
+                    process.terminate()
+            else:
+                process.terminate()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, ProcessLookupError):
+            return False
+        return True
+    
+    def _finish_popen_processes(self, processes: List[Any], graceful_timeout: float) -> List[Any]:
+        """
+        Wait for already-signalled Popen processes together, force killing holdouts.
+        
+        Args:
+            processes: Popen-like objects that were asked to stop
+            graceful_timeout: Shared timeout in seconds for graceful shutdown
+            
+        Returns:
+            List of processes still running
+        """
+        def wait_for(procs: List[Any], timeout: float) -> List[Any]:
+            self._poll_with_backoff(lambda: all(proc.poll() is not None for proc in procs), timeout)
+            return [proc for proc in procs if proc.poll() is None]
+        
+        alive = wait_for(processes, graceful_timeout)
+        if not alive:
+            return alive
+        
+        self._update_status(f"Graceful shutdown timed out, force killing {len(alive)} processes...")
+        for proc in alive:
+            try:
+                proc.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, ProcessLookupError):
+                pass
+        return wait_for(alive, 5)
+    
+    def _stop_popen_process(self, process, graceful_timeout: int):
+        """Stop a process through its Popen object when psutil cannot inspect it."""
+        if self._signal_popen_process(process):
+            self._finish_popen_processes([process], graceful_timeout)
+    
     def stop_process(self, name: str, graceful_timeout: int = 10) -> Tuple[bool, str]:
         """
         Stop a named process gracefully, including all child processes.
@@ -191,77 +474,31 @@ class ProcessManager:
                 del self.processes[name]
                 return True, ""
             
+            self._update_status(f"Attempting graceful shutdown of process tree for '{name}'...")
+            
+            pgid = process_info.get("pgid")
+            if pgid is not None:
+                # One signal reaches the whole process group started by start_process
+                self._signal_process_group(pgid, signal.SIGTERM)
+                if self._finish_process_groups({pgid: process}, graceful_timeout):
+                    self._update_status(f"Process group for '{name}' did not exit after force kill")
+                else:
+                    self._update_status(f"Process tree for '{name}' stopped")
+                del self.processes[name]
+                return True, ""
+            
             # Get the process tree (parent + all children) using psutil
-            import psutil
-            try:
-                parent_process = psutil.Process(process_info["pid"])
-                process_tree = [parent_process] + parent_process.children(recursive=True)
+            process_tree = self._collect_process_tree(process_info)
+            if process_tree:
                 self._update_status(f"Found {len(process_tree)} processes in tree for '{name}'")
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                _, alive = self._terminate_process_trees(process_tree, graceful_timeout)
+                if alive:
+                    self._update_status(f"{len(alive)} processes for '{name}' did not exit after force kill")
+                else:
+                    self._update_status(f"Process tree for '{name}' stopped")
+            else:
                 # Fallback to original process if psutil fails
-                process_tree = [process]
-            
-            # Try graceful shutdown first
-            self._update_status(f"Attempting graceful shutdown of process tree for '{name}'...")
-            
-            # Send termination signal to all processes in the tree
-            for proc in process_tree:
-                try:
-                    if isinstance(proc, psutil.Process):
-                        proc.terminate()
-                    else:
-                        # Original subprocess.Popen object
-                        if PlatformUtils.get_os_type() == 'windows':
-                            try:
-                                proc.send_signal(signal.CTRL_BREAK_EVENT)
-                            except:
-                                proc.terminate()
-                        else:
-                            proc.terminate()
-                except (psutil.NoSuchProcess, psutil.AccessDenied, ProcessLookupError):
-                    continue  # Process already dead or no access
-            
-            # Wait for graceful shutdown
-            all_stopped = True
-            try:
-                # Wait for the main process
-                process.wait(timeout=graceful_timeout)
-                self._update_status(f"Main process '{name}' stopped gracefully")
-                
-                # Check if all child processes are also stopped
-                for proc in process_tree:
-                    if isinstance(proc, psutil.Process):
-                        try:
-                            if proc.is_running():
-                                all_stopped = False
-                                break
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            continue  # Process is dead
-                            
-            except subprocess.TimeoutExpired:
-                all_stopped = False
-            
-            if not all_stopped:
-                # Force kill all remaining processes
-                self._update_status(f"Graceful shutdown timed out, force killing process tree for '{name}'...")
-                for proc in process_tree:
-                    try:
-                        if isinstance(proc, psutil.Process):
-                            if proc.is_running():
-                                proc.kill()
-                        else:
-                            # Original subprocess.Popen object
-                            proc.kill()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, ProcessLookupError):
-                        continue  # Process already dead or no access
-                
-                # Wait a bit more for force kill
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    pass  # Process might be completely stuck
-                    
-                self._update_status(f"Process tree for '{name}' force killed")
+                self._stop_popen_process(process, graceful_timeout)
             
             # Clean up process tracking
             del self.processes[name]
@@ -325,16 +562,21 @@ class ProcessManager:
         
         if status["running"]:
             try:
-                # Get additional process information using psutil
-                ps_process = psutil.Process(process_info["pid"])
-                status.update({
-                    "cpu_percent": ps_process.cpu_percent(),
-                    "memory_info": ps_process.memory_info()._asdict(),
-                    "status": ps_process.status(),
-                    "create_time": ps_process.create_time(),
-                    "uptime": time.time() - process_info["start_time"]
-                })
+                # Get additional process information using the cached psutil handle
+                ps_process = process_info.get("ps_process")
+                if ps_process is None:
+                    ps_process = psutil.Process(process_info["pid"])
+                    process_info["ps_process"] = ps_process
+                with ps_process.oneshot():
+                    status.update({
+                        "cpu_percent": ps_process.cpu_percent(),
+                        "memory_info": ps_process.memory_info()._asdict(),
+                        "status": ps_process.status(),
+                        "create_time": ps_process.create_time(),
+                        "uptime": time.time() - process_info["start_time"]
+                    })
             except (psutil.NoSuchProcess, psutil.AccessDenied):
+                process_info["ps_process"] = None
                 status["running"] = False
                 status["error"] = "Process no longer accessible"
         else:
@@ -348,7 +590,7 @@ class ProcessManager:
         Stop all managed processes.
         
         Args:
-            graceful_timeout: Timeout in seconds for graceful shutdown per process
+            graceful_timeout: Timeout in seconds for graceful shutdown, shared by all processes
             
         Returns:
             Tuple of (overall_success, stop_results)
@@ -366,21 +608,61 @@ class ProcessManager:
             "stop_details": {}
         }
         
-        # Get list of process names to avoid dictionary changing during iteration
-        process_names = list(self.processes.keys())
+        # Signal every process tree up front so all of them share one shutdown timeout
+        deadline = time.monotonic() + graceful_timeout
+        trees = {}
+        groups = {}
+        popens = {}
+        all_procs = []
+        for name, process_info in list(self.processes.items()):
+            if not self.is_process_running(name):
+                trees[name] = []
+                continue
+            pgid = process_info.get("pgid")
+            if pgid is not None:
+                self._signal_process_group(pgid, signal.SIGTERM)
+                groups[name] = pgid
+                trees[name] = []
+                continue
+            tree = self._collect_process_tree(process_info)
+            if not tree:
+                # psutil can't see it; stop through the Popen object instead
+                process = process_info["process"]
+                if self._signal_popen_process(process):
+                    popens[name] = process
+            trees[name] = tree
+            all_procs.extend(tree)
         
-        for name in process_names:
-            success, error_msg = self.stop_process(name, graceful_timeout)
-            
-            if success:
-                stop_results["processes_stopped"] += 1
-                stop_results["stop_details"][name] = {"status": "stopped"}
-            else:
+        alive_pids = set()
+        if all_procs:
+            _, alive = self._terminate_process_trees(all_procs, max(0.0, deadline - time.monotonic()))
+            alive_pids = {proc.pid for proc in alive}
+        
+        alive_groups = set()
+        if groups:
+            leaders = {pgid: self.processes[name]["process"] for name, pgid in groups.items()}
+            alive_groups = set(self._finish_process_groups(leaders, max(0.0, deadline - time.monotonic())))
+        
+        alive_popens = []
+        if popens:
+            alive_popens = self._finish_popen_processes(list(popens.values()), max(0.0, deadline - time.monotonic()))
+        
+        for name, tree in trees.items():
+            still_alive = [proc.pid for proc in tree if proc.pid in alive_pids]
+            if groups.get(name) in alive_groups:
+                still_alive.append(groups[name])
+            if name in popens and popens[name] in alive_popens:
+                still_alive.append(popens[name].pid)
+            if still_alive:
                 stop_results["processes_failed"] += 1
                 stop_results["stop_details"][name] = {
                     "status": "failed",
-                    "error": error_msg
+                    "error": f"Processes still running after force kill: {still_alive}"
                 }
+            else:
+                stop_results["processes_stopped"] += 1
+                stop_results["stop_details"][name] = {"status": "stopped"}
+            del self.processes[name]
         
         self._update_status(
             f"Process shutdown complete: {stop_results['processes_stopped']} stopped, "
@@ -411,6 +693,8 @@ class ProcessManager:
         command = process_info["command"]
         cwd = process_info["cwd"]
         env = process_info["env"]
+        readiness_port = process_info.get("readiness_port")
+        readiness_check = process_info.get("readiness_check")
         
         # Stop the process
         success, error_msg = self.stop_process(name)
@@ -422,7 +706,9 @@ class ProcessManager:
         
         # Start the process again
         return self.start_process(name, command, cwd, env, wait_for_startup=True, 
-                                startup_timeout=startup_timeout)
+                                startup_timeout=startup_timeout,
+                                readiness_port=readiness_port,
+                                readiness_check=readiness_check)
     
     def get_all_process_status(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -449,8 +735,6 @@ class ProcessManager:
         Returns:
             True if port is available
         """
-        import socket
-        
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                 sock.settimeout(1)
@@ -472,21 +756,48 @@ class ProcessManager:
         Returns:
             True if port becomes available within timeout
         """
-        import socket
+        return self._poll_with_backoff(lambda: self._port_accepting(host, port), timeout)
+    
+    @staticmethod
+    def _port_accepting(host: str, port: int, timeout: float = 0.25) -> bool:
+        """Return True if a TCP connection to host:port succeeds."""
+        try:
+            with socket.create_connection((host, port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+    
+    @staticmethod
+    def _poll_with_backoff(probe: Callable[[], bool], timeout: float,
+                           alive: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Call probe until it returns True, sleeping 25 ms doubling up to 500 ms.
         
-        start_time = time.time()
+        Args:
+            probe: Readiness check to poll
+            timeout: Overall timeout in seconds
+            alive: Optional liveness check; polling stops early once it returns False
+            
+        Returns:
+            True if probe succeeded within timeout
+        """
+        delay = 0.025
+        deadline = time.monotonic() + timeout
         
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
+            if alive is not None and not alive():
+                return False
             try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                    sock.settimeout(1)
-                    result = sock.connect_ex((host, port))
-                    if result == 0:  # Connection successful
-                        return True
-            except:
+                if probe():
+                    return True
+            except Exception:
                 pass
             
-            time.sleep(1)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
         
         return False
     
@@ -501,21 +812,45 @@ class ProcessManager:
         Returns:
             True if process appears to be ready
         """
-        start_time = time.time()
+        process_info = self.processes.get(name, {})
+        readiness_port = process_info.get("readiness_port")
+        readiness_check = process_info.get("readiness_check")
         
-        while time.time() - start_time < timeout:
-            if not self.is_process_running(name):
-                return False  # Process died
-            
-            # For now, just wait a bit and assume it's ready
-            # In a real implementation, you might check specific ports or log files
-            time.sleep(2)
+        def alive() -> bool:
+            return self.is_process_running(name)
+        
+        if readiness_port is not None or readiness_check is not None:
+            def ready() -> bool:
+                if readiness_port is not None and not self._port_accepting("localhost", readiness_port):
+                    return False
+                return readiness_check is None or readiness_check()
             
-            # Simple readiness check - if process is still running after 2 seconds, assume ready
-            if time.time() - start_time >= 2:
-                return True
+            return self._poll_with_backoff(ready, timeout, alive=alive)
         
-        return False
+        # No probe available: treat the process as ready if it survives the first 2 seconds
+        settle_deadline = time.monotonic() + min(2, timeout)
+        while time.monotonic() < settle_deadline:
+            if not alive():
+                return False  # Process died
+            time.sleep(0.1)
+        
+        return alive()
+    
+    @staticmethod
+    def _children_may_have_exited() -> bool:
+        """
+        Ask the kernel once whether any child process has exited but not been reaped.
+        
+        Uses waitid(WNOWAIT) so no exit status is consumed; other subprocess calls
+        in the installer still collect their own children. Returns True whenever
+        the answer is unknown.
+        """
+        if _IS_WINDOWS or not hasattr(os, "waitid"):
+            return True
+        try:
+            return os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None
+        except OSError:
+            return True  # No children at all, or waitid unsupported
     
     def cleanup_dead_processes(self) -> int:
         """
@@ -524,15 +859,21 @@ class ProcessManager:
         Returns:
             Number of dead processes cleaned up
         """
-        dead_processes = []
+        if self._children_may_have_exited():
+            candidates = list(self.processes)
+        else:
+            # No spawned child has exited, so only adopted processes (not our children)
+            # and already-reaped entries can be dead
+            candidates = [
+                name for name, info in self.processes.items()
+                if info.get("adopted") or info["process"].returncode is not None
+            ]
         
-        for name in self.processes:
-            if not self.is_process_running(name):
-                dead_processes.append(name)
+        dead_processes = [name for name in candidates if not self.is_process_running(name)]
         
         for name in dead_processes:
             del self.processes[name]
-            self.logger.debug(f"Cleaned up dead process: {name}")
+            self.logger.debug("Cleaned up dead process: %s", name)
         
         return len(dead_processes)
     
@@ -550,139 +891,103 @@ class ProcessManager:
         if name not in self.processes:
             return False, "", "Process not found"
         
-        process = self.processes[name]["process"]
+        process_info = self.processes[name]
+        if not process_info.get("stdout_path"):
+            return False, "", "No output log for this process"
         
-        try:
-            # This is a simplified implementation
-            # In practice, you might want to implement proper log file handling
-            stdout_data = ""
-            stderr_data = ""
-            
-            if process.stdout:
-                # Read available data (non-blocking)
-                import select
-                import sys
-                
-                if sys.platform != 'win32':
-                    # Unix-like systems
-                    ready, _, _ = select.select([process.stdout], [], [], 0)
-                    if ready:
-                        stdout_data = process.stdout.read()
-                
-            if process.stderr:
-                if sys.platform != 'win32':
-                    ready, _, _ = select.select([process.stderr], [], [], 0)
-                    if ready:
-                        stderr_data = process.stderr.read()
+        stdout_data = self._read_log_tail(process_info["stdout_path"], lines)
+        stderr_data = self._read_log_tail(process_info.get("stderr_path"), lines)
+        return True, stdout_data, stderr_data
+    
+    def snapshot_processes(self, attrs: Tuple[str, ...] = ('pid', 'name', 'cmdline', 'create_time')) -> List[Tuple]:
+        """
+        Scan the system process table once.
+        
+        Args:
+            attrs: psutil attributes to fetch for every process
             
-            return True, stdout_data, stderr_data
-
-        except Exception as e:
-            return False, "", f"Error reading process logs: {str(e)}"
+        Returns:
+            List of (pid, name, cmdline_list, create_time) tuples; command lines
+            are left unjoined so callers only build strings for candidates
+        """
+        snapshot = []
+        try:
+            for proc in psutil.process_iter(list(attrs)):
+                info = proc.info
+                snapshot.append((info['pid'], info.get('name') or '', info.get('cmdline') or (), info.get('create_time')))
+        except psutil.Error as e:
+            self.logger.warning(f"Process scan ended early: {e}")
+        return snapshot
     
-    def adopt_orphaned_processes(self) -> int:
+    def _adopt_process(self, name: str, pid: int, cmdline, create_time) -> bool:
+        """Start tracking an already running process under the given name."""
+        try:
+            ps_process = psutil.Process(pid)
+            if create_time is not None and ps_process.create_time() != create_time:
+                return False  # PID was reused since the scan
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
+        
+        # Wrap the psutil handle so it can be tracked like a Popen object
+        self.processes[name] = {
+            "process": _AdoptedProcess(ps_process),
+            "ps_process": ps_process,
+            "command": list(cmdline),
+            "command_str": shlex.join(cmdline),
+            "cwd": "unknown",
+            "env": {},
+            "start_time": create_time,
+            "pid": pid,
+            "adopted": True
+        }
+        return True
+    
+    def adopt_orphaned_processes(self, snapshot: Optional[List[Tuple]] = None) -> int:
         """
         Detect and adopt orphaned BrainDrive processes that are running but not tracked.
         
+        Args:
+            snapshot: Result of snapshot_processes() to reuse instead of scanning again
+        
         Returns:
             Number of processes adopted
         """
-        import psutil
         adopted_count = 0
         
         try:
             self._update_status("Scanning for orphaned BrainDrive processes...")
+            if snapshot is None:
+                snapshot = self.snapshot_processes()
             
-            # Look for BrainDrive backend processes (uvicorn)
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time']):
-                try:
-                    cmdline = proc.info['cmdline']
-                    if not cmdline:
+            for pid, proc_name, cmdline, create_time in snapshot:
+                # Cheap filters first: almost every process on the system is rejected here
+                if not cmdline or not proc_name.lower().startswith(_ADOPTION_NAME_PREFIXES):
+                    continue
+                if not any('uvicorn' in arg or 'npm' in arg for arg in cmdline):
+                    continue
+                
+                cmdline_str = ' '.join(cmdline)
+                
+                for name, label, required, ports in _ADOPTION_RULES:
+                    if name in self.processes or not all(token in cmdline_str for token in required):
                         continue
                     
-                    cmdline_str = ' '.join(cmdline)
-                    
-                    backend_port_match = next(
+                    port_match = next(
                         (
-                            port for port in MANAGED_BACKEND_PORTS
+                            port for port in ports
                             if f"--port {port}" in cmdline_str or f"--port={port}" in cmdline_str
                         ),
                         None
                     )
+                    if port_match is None:
+                        continue
                     
-                    # Check for BrainDrive backend (uvicorn main:app)
-                    if ('uvicorn' in cmdline_str and
-                        'main:app' in cmdline_str and
-                        backend_port_match is not None and
-                        'braindrive_backend' not in self.processes):
-                        
+                    if self._adopt_process(name, pid, cmdline, create_time):
                         self._update_status(
-                            f"Found orphaned backend process (PID: {proc.info['pid']}, port {backend_port_match})"
+                            f"Found orphaned {label} process (PID: {pid}, port {port_match})"
                         )
-                        
-                        # Create a mock process object to track it
-                        mock_process = type('MockProcess', (), {
-                            'pid': proc.info['pid'],
-                            'poll': lambda: None if psutil.pid_exists(proc.info['pid']) else 0,
-                            'terminate': lambda: psutil.Process(proc.info['pid']).terminate(),
-                            'kill': lambda: psutil.Process(proc.info['pid']).kill(),
-                            'wait': lambda timeout=None: psutil.Process(proc.info['pid']).wait(timeout)
-                        })()
-                        
-                        # Adopt the process
-                        self.processes['braindrive_backend'] = {
-                            "process": mock_process,
-                            "command": cmdline,
-                            "cwd": "unknown",
-                            "env": {},
-                            "start_time": proc.info['create_time'],
-                            "pid": proc.info['pid'],
-                            "adopted": True
-                        }
                         adopted_count += 1
-                        
-                    # Check for BrainDrive frontend (npm run dev)
-                    elif ('npm' in cmdline_str and
-                          'run' in cmdline_str and
-                          'dev' in cmdline_str and
-                          'braindrive_frontend' not in self.processes):
-                        
-                        frontend_port_match = next(
-                            (
-                                port for port in MANAGED_FRONTEND_PORTS
-                                if f"--port {port}" in cmdline_str or f"--port={port}" in cmdline_str
-                            ),
-                            None
-                        )
-                        
-                        if frontend_port_match is not None:
-                            self._update_status(
-                                f"Found orphaned frontend process (PID: {proc.info['pid']}, port {frontend_port_match})"
-                            )
-                            
-                            # Create a mock process object to track it
-                            mock_process = type('MockProcess', (), {
-                                'pid': proc.info['pid'],
-                                'poll': lambda: None if psutil.pid_exists(proc.info['pid']) else 0,
-                                'terminate': lambda: psutil.Process(proc.info['pid']).terminate(),
-                                'kill': lambda: psutil.Process(proc.info['pid']).kill(),
-                                'wait': lambda timeout=None: psutil.Process(proc.info['pid']).wait(timeout)
-                            })()
-                            
-                            # Adopt the process
-                            self.processes['braindrive_frontend'] = {
-                                "process": mock_process,
-                                "command": cmdline,
-                                "cwd": "unknown",
-                                "env": {},
-                                "start_time": proc.info['create_time'],
-                                "pid": proc.info['pid'],
-                                "adopted": True
-                            }
-                            adopted_count += 1
-                            
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    continue
+                    break
                     
             if adopted_count > 0:
                 self._update_status(f"Adopted {adopted_count} orphaned BrainDrive processes")
@@ -694,7 +999,8 @@ class ProcessManager:
             
         return adopted_count
     
-    def kill_processes_by_pattern(self, patterns: list, description: str = "processes") -> int:
+    def kill_processes_by_pattern(self, patterns: list, description: str = "processes",
+                                  snapshot: Optional[List[Tuple]] = None) -> int:
         """
         Kill all processes matching specific command line patterns.
         This is a backup cleanup method for stubborn processes.
@@ -702,41 +1008,75 @@ class ProcessManager:
         Args:
             patterns: List of strings to match in command lines
             description: Description for logging
+            snapshot: Result of snapshot_processes() to reuse instead of scanning again
             
         Returns:
             Number of processes killed
         """
-        import psutil
-        killed_count = 0
+        return self.kill_processes_by_patterns({description: patterns}, snapshot)[description]
+    
+    def kill_processes_by_patterns(self, groups: Dict[str, Any],
+                                   snapshot: Optional[List[Tuple]] = None) -> Dict[str, int]:
+        """
+        Kill processes matching any of several pattern groups in one pass over the process table.
+        
+        Args:
+            groups: Description -> list of strings to match in command lines, or a
+                compiled pattern (see compile_patterns); a process matching several
+                groups is counted under the first
+            snapshot: Result of snapshot_processes() to reuse instead of scanning again
+            
+        Returns:
+            Description -> number of processes killed
+        """
+        killed = dict.fromkeys(groups, 0)
+        label = " and ".join(groups)
+        group_res = [
+            (description, patterns if isinstance(patterns, re.Pattern) else compile_patterns(patterns))
+            for description, patterns in groups.items()
+            if patterns
+        ]
+        if not group_res:
+            return killed
         
         try:
-            self._update_status(f"Scanning for {description} to kill...")
+            self._update_status(f"Scanning for {label} to kill...")
+            if snapshot is None:
+                snapshot = self.snapshot_processes(('pid', 'cmdline'))
             
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            # One alternation over every group rejects unrelated command lines in a
+            # single scan; only matches are attributed to a group
+            any_pattern = re.compile("|".join(f"(?:{group_re.pattern})" for _, group_re in group_res))
+            
+            for pid, _, cmdline, _ in snapshot:
+                if not cmdline:
+                    continue
+                
+                # Patterns may span arguments ("npm run dev"), so match the joined command line
+                cmdline_str = ' '.join(cmdline)
+                if not any_pattern.search(cmdline_str):
+                    continue
+                
+                description, pattern = next(
+                    (description, match.group(0))
+                    for description, group_re in group_res
+                    for match in (group_re.search(cmdline_str),) if match
+                )
+                
                 try:
-                    cmdline = proc.info['cmdline']
-                    if not cmdline:
-                        continue
-                    
-                    cmdline_str = ' '.join(cmdline)
-                    
-                    # Check if any pattern matches
-                    for pattern in patterns:
-                        if pattern in cmdline_str:
-                            self._update_status(f"Killing process (PID: {proc.info['pid']}): {pattern}")
-                            psutil.Process(proc.info['pid']).kill()
-                            killed_count += 1
-                            break  # Don't double-kill the same process
-                            
+                    self._update_status(f"Killing process (PID: {pid}): {pattern}")
+                    psutil.Process(pid).kill()
+                    killed[description] += 1
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     continue
-                    
-            if killed_count > 0:
-                self._update_status(f"Killed {killed_count} {description}")
-            else:
-                self._update_status(f"No {description} found to kill")
+            
+            for description, killed_count in killed.items():
+                if killed_count > 0:
+                    self._update_status(f"Killed {killed_count} {description}")
+                else:
+                    self._update_status(f"No {description} found to kill")
                 
         except Exception as e:
-            self._update_status(f"Error killing {description}: {str(e)}")
+            self._update_status(f"Error killing {label}: {str(e)}")
             
-        return killed_count
+        return killed
@@ -0,0 +1,308 @@
+"""
+Shared process discovery and termination for the BrainDrive cleanup scripts.
+
+Strict mode finds only actual BrainDrive backend/frontend servers; loose mode is the
+emergency sweep that matches anything BrainDrive-related.
+"""
+import os
+import psutil
+import re
+import signal
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_PORT = 8005
+FRONTEND_PORT = 5173
+
+# Executable name prefixes (lowercase) that BrainDrive servers run under; "conda run" wraps both
+_CANDIDATE_NAME_PREFIXES = ('python', 'node', 'uvicorn', 'npm', 'vite', 'conda')
+
+# Command line patterns, one alternation each so a command line is scanned once
+_BACKEND_RE = re.compile(r'uvicorn main:app|python main\.py|fastapi|--port 8005')
+_FRONTEND_RE = re.compile(r'npm run dev|vite|--port 5173')  # "vite" also covers node_modules/.bin/vite
+
+# Windows executables that count as BrainDrive servers when run from the matching directory
+_SERVER_DIR_BY_NAME = {'python.exe': 'backend', 'node.exe': 'frontend'}
+
+# BrainDrive-related patterns, matched per argument so loose mode need not join every command line
+_BRAINDRIVE_ARG_RE = re.compile(r'uvicorn|vite|braindrive|npm run dev', re.IGNORECASE)  # short, common first
+
+# Worker threads for per-process inspection; each cmdline/cwd read is a blocking syscall
+_INSPECT_WORKERS = 16
+
+def check_port_in_use(port):
+    """Check if a port is in use"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            # Loopback answers at once; a short timeout keeps filtered ports from stalling
+            s.settimeout(0.1)
+            result = s.connect_ex(('127.0.0.1', port))
+            return result == 0
+    except:
+        return False
+
+def check_ports_in_use(ports):
+    """Check several ports, returning a list of in-use flags in order"""
+    # One read of the OS socket table answers every port without opening connections
+    try:
+        listening = {
+            conn.laddr.port for conn in psutil.net_connections(kind='tcp')
+            if conn.status == psutil.CONN_LISTEN and conn.laddr
+        }
+    except psutil.Error:
+        # Listing sockets can need elevated privileges (e.g. macOS); probe each port instead
+        with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+            return list(executor.map(check_port_in_use, ports))
+    return [port in listening for port in ports]
+
+def _is_braindrive_server(name, cmdline_parts, cwd):
+    """Strict match: actual BrainDrive backend/frontend servers only"""
+    # Backend/frontend patterns span arguments; only name-filtered candidates get here
+    cmdline = ' '.join(cmdline_parts)
+
+    # Backend patterns identify the server wherever it runs from
+    if _BACKEND_RE.search(cmdline):
+        return True
+
+    # Everything else must be running inside a BrainDrive directory
+    cwd_lc = cwd.lower()
+    if 'braindrive' not in cwd_lc:
+        return False
+
+    # Frontend patterns, or a bare python/node process in the backend/frontend directory
+    if _FRONTEND_RE.search(cmdline):
+        return True
+    server_dir = _SERVER_DIR_BY_NAME.get(name)
+    return server_dir is not None and server_dir in cwd_lc
+
+def _is_braindrive_related(name, cmdline_parts, cwd):
+    """Loose match: anything mentioning BrainDrive or its dev servers"""
+    if any(_BRAINDRIVE_ARG_RE.search(arg) for arg in cmdline_parts):
+        return True
+    # "npm run dev" as separate arguments is the one pattern that needs the joined command line
+    if 'run' in cmdline_parts and 'npm run dev' in ' '.join(cmdline_parts).lower():
+        return True
+    return 'braindrive' in cwd.lower()
+
+def _inspect_process(proc, strict):
+    """Return a process info dict if proc matches, else None"""
+    try:
+        # oneshot lets platforms that fetch several attributes per query reuse one read
+        with proc.oneshot():
+            cmdline_parts = proc.cmdline() or []
+            cwd = proc.cwd() or ''
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        return None
+
+    name = proc.info['name']
+    matches = _is_braindrive_server if strict else _is_braindrive_related
+    if not matches(name, cmdline_parts, cwd):
+        return None
+    return {
+        'pid': proc.info['pid'],
+        'name': name,
+        'cmdline': ' '.join(cmdline_parts),
+        'cwd': cwd
+    }
+
+def find_processes(strict=True):
+    """
+    Find BrainDrive processes.
+
+    Args:
+        strict: Only match actual backend/frontend servers (otherwise anything BrainDrive-related)
+
+    Returns:
+        List of dicts with pid, name, cmdline and cwd
+    """
+    # Phase 1: names only; strict mode never reads cmdline/cwd of unrelated processes
+    candidates = []
+    # This script and the shell that launched it usually sit in a BrainDrive directory too
+    own_pids = {os.getpid()} | {parent.pid for parent in psutil.Process().parents()}
+    for proc in psutil.process_iter(['pid', 'name']):
+        name = proc.info['name'] or ''
+        if proc.info['pid'] in own_pids:
+            continue
+        if not strict or name.lower().startswith(_CANDIDATE_NAME_PREFIXES):
+            candidates.append(proc)
+
+    if not candidates:
+        return []
+
+    # Phase 2: inspect the candidates concurrently; results keep process table order
+    with ThreadPoolExecutor(max_workers=min(_INSPECT_WORKERS, len(candidates))) as executor:
+        results = executor.map(lambda proc: _inspect_process(proc, strict), candidates)
+        return [info for info in results if info is not None]
+
+def _separate_group_leaders(pids):
+    """POSIX: the pids that lead their own process group (not ours), so killpg reaches their tree"""
+    if not hasattr(os, 'killpg'):
+        return set()
+    own_pgid = os.getpgrp()
+    leaders = set()
+    for pid in pids:
+        try:
+            if os.getpgid(pid) == pid != own_pgid:
+                leaders.add(pid)
+        except OSError:
+            pass
+    return leaders
+
+def _signal_groups(pgids, sig):
+    """Send sig to every process group, returning the groups that received it"""
+    signalled = set()
+    for pgid in pgids:
+        try:
+            os.killpg(pgid, sig)
+            signalled.add(pgid)
+        except OSError:
+            pass
+    return signalled
+
+def kill_process_trees(pids):
+    """
+    Kill several processes and all their children, sharing one wait across every tree.
+
+    Returns:
+        Processes that ignored terminate and had to be force killed
+    """
+    targets = []
+    seen = set()
+    for pid in pids:
+        try:
+            parent = psutil.Process(pid)
+            children = parent.children(recursive=True)
+        except psutil.NoSuchProcess:
+            print(f"  Process {pid} already gone")
+            continue
+
+        # Children first, then the parent; a tree may already be part of an earlier one
+        for proc in children + [parent]:
+            if proc.pid not in seen:
+                seen.add(proc.pid)
+                targets.append(proc)
+
+    # Signal everything before waiting on anything. Servers started in their own session get
+    # one killpg for the whole group, which also reaches children forked after the walk above
+    groups = _signal_groups(_separate_group_leaders(pids), signal.SIGTERM) if targets else set()
+    for proc in targets:
+        try:
+            print(f"  Killing process {proc.pid} ({proc.name()})")
+            if not groups or os.getpgid(proc.pid) not in groups:
+                proc.terminate()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, OSError):
+            pass
+
+    # Wait for termination
+    gone, alive = psutil.wait_procs(targets, timeout=5)
+
+    # Force kill if still alive
+    if alive and groups:
+        _signal_groups(groups, signal.SIGKILL)
+    for proc in alive:
+        try:
+            print(f"  Force killing stubborn process {proc.pid}")
+            proc.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return alive
+
+def kill_process_tree(pid):
+    """Kill a process and all its children"""
+    kill_process_trees([pid])
+
+def _flush_report(report):
+    """Write buffered report lines to stdout in one call"""
+    if report:
+        sys.stdout.write('\n'.join(report) + '\n')
+        sys.stdout.flush()
+        report.clear()
+
+def _report_port_status(out, backend_port_active, frontend_port_active, in_use, free):
+    out(f"Backend port {BACKEND_PORT}: {in_use if backend_port_active else free}")
+    out(f"Frontend port {FRONTEND_PORT}: {in_use if frontend_port_active else free}")
+
+def cleanup(strict=True):
+    """
+    Find and terminate BrainDrive processes, reporting progress on stdout.
+
+    Args:
+        strict: Targeted cleanup of the servers (with port checks) instead of the emergency sweep
+    """
+    # Console writes are slow on Windows; emit the report in a few blocks instead of per line
+    report = []
+    try:
+        _cleanup(strict, report)
+    finally:
+        _flush_report(report)
+
+def _cleanup(strict, report):
+    """Body of cleanup(); report lines are appended to report and flushed at wait points"""
+    out = report.append
+    if strict:
+        out("🔍 Searching for actual BrainDrive backend/frontend processes...")
+
+        # Check ports first
+        backend_port_active, frontend_port_active = check_ports_in_use((BACKEND_PORT, FRONTEND_PORT))
+        _report_port_status(out, backend_port_active, frontend_port_active, '🔴 IN USE', '🟢 FREE')
+
+        # Servers that hold no port have nothing left to release; skip the process table scan
+        if not (backend_port_active or frontend_port_active):
+            out("✅ No BrainDrive processes found and ports are free")
+            return
+
+        processes = find_processes(strict=True)
+
+        if not processes:
+            out("⚠️  Ports are in use but no BrainDrive processes found!")
+            out("This might indicate hidden or system processes using these ports.")
+            return
+
+        out(f"\n🎯 Found {len(processes)} actual BrainDrive processes:")
+        for proc in processes:
+            out(f"  PID {proc['pid']}: {proc['name']}")
+            out(f"    CMD: {proc['cmdline'][:80]}...")
+            out(f"    CWD: {proc['cwd']}")
+
+        out("\n🛑 Terminating BrainDrive processes...")
+    else:
+        out("🔍 Searching for BrainDrive processes...")
+        processes = find_processes(strict=False)
+
+        if not processes:
+            out("✅ No BrainDrive processes found")
+            return
+
+        out(f"🎯 Found {len(processes)} BrainDrive-related processes:")
+        for proc in processes:
+            out(f"  PID {proc['pid']}: {proc['name']} - {proc['cmdline'][:100]}...")
+
+        out("\n🛑 Terminating processes...")
+
+    for proc in processes:
+        out(f"Terminating PID {proc['pid']} ({proc['name']})")
+    _flush_report(report)  # Show what is being terminated before waiting on it
+    stubborn = kill_process_trees([proc['pid'] for proc in processes])
+
+    # Everything that exited on terminate is already reaped; only force-killed ones may linger
+    out("\n⏳ Waiting for cleanup...")
+    _flush_report(report)
+    psutil.wait_procs(stubborn, timeout=3 if strict else 2)
+
+    if strict:
+        # Check ports again
+        backend_port_active, frontend_port_active = check_ports_in_use((BACKEND_PORT, FRONTEND_PORT))
+        _report_port_status(out, backend_port_active, frontend_port_active, '🔴 STILL IN USE', '🟢 NOW FREE')
+
+    # Check if any are still running
+    remaining = find_processes(strict)
+    if remaining:
+        out(f"⚠️  {len(remaining)} processes still running:")
+        for proc in remaining:
+            out(f"  PID {proc['pid']}: {proc['name']}")
+    else:
+        out("✅ All BrainDrive processes terminated successfully")
+
+    if strict and not backend_port_active and not frontend_port_active:
+        out("🎉 Directory should now be deletable!")
@@ -4,45 +4,54 @@ Script to create a simple BrainDrive logo image for the installer.
 This creates a basic placeholder image that can be replaced with actual branding later.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+import functools
 import os
 
-def create_braindrive_logo():
-    """Create a simple BrainDrive logo image."""
+@functools.lru_cache(maxsize=8)
+def _get_font(size):
+    """Load Arial at the given size, falling back to Pillow's default font."""
+    from PIL import ImageFont
     
-    # Create a 200x200 image with a gradient background
-    size = (200, 200)
-    image = Image.new('RGB', size, color='#1e3a8a')  # Dark blue background
-    draw = ImageDraw.Draw(image)
+    try:
+        # Try to use a system font
+        return ImageFont.truetype("arial.ttf", size)
+    except:
+        try:
+            return ImageFont.truetype("/System/Library/Fonts/Arial.ttf", size)
+        except:
+            # Fallback to default font
+            return ImageFont.load_default()
+
+def create_braindrive_logo(size=(200, 200)):
+    """Create a simple BrainDrive logo image at the given (width, height)."""
+    # Pillow is only needed when a logo is actually drawn
+    from PIL import Image, ImageDraw
+    
+    # Geometry is laid out for 200x200 and scaled from there
+    scale = size[0] / 200
     
-    # Create a gradient effect
+    # Build the gradient as a one-pixel column and stretch it, instead of drawing each row
+    column = bytearray()
     for y in range(size[1]):
         # Gradient from dark blue to lighter blue
         color_value = int(30 + (y / size[1]) * 100)  # 30 to 130
-        color = (color_value, color_value + 50, 255)  # Blue gradient
-        draw.line([(0, y), (size[0], y)], fill=color)
+        column += bytes((color_value, color_value + 50, 255))  # Blue gradient
+    image = Image.frombytes('RGB', (1, size[1]), bytes(column)).resize(size, Image.Resampling.NEAREST)
+    draw = ImageDraw.Draw(image)
     
     # Draw a circle in the center
     circle_center = (size[0] // 2, size[1] // 2)
-    circle_radius = 60
+    circle_radius = int(60 * scale)
     circle_bbox = [
         circle_center[0] - circle_radius,
         circle_center[1] - circle_radius,
         circle_center[0] + circle_radius,
         circle_center[1] + circle_radius
     ]
-    draw.ellipse(circle_bbox, fill='#ffffff', outline='#fbbf24', width=4)
+    draw.ellipse(circle_bbox, fill='#ffffff', outline='#fbbf24', width=max(1, int(4 * scale)))
     
     # Draw "BD" text in the circle
-    try:
-        # Try to use a system font
-        font = ImageFont.truetype("arial.ttf", 36)
-    except:
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 36)
-        except:
-            # Fallback to default font
-            font = ImageFont.load_default()
+    font = _get_font(int(36 * scale))
     
     text = "BD"
     text_bbox = draw.textbbox((0, 0), text, font=font)
@@ -53,22 +62,17 @@ def create_braindrive_logo():
     
     draw.text((text_x, text_y), text, fill='#1e3a8a', font=font)
     
-    # Add "BrainDrive" text below the circle
-    try:
-        title_font = ImageFont.truetype("arial.ttf", 16)
-    except:
-        try:
-            title_font = ImageFont.truetype("/System/Library/Fonts/Arial.ttf", 16)
-        except:
-            title_font = ImageFont.load_default()
-    
-    title_text = "BrainDrive"
-    title_bbox = draw.textbbox((0, 0), title_text, font=title_font)
-    title_width = title_bbox[2] - title_bbox[0]
-    title_x = size[0] // 2 - title_width // 2
-    title_y = circle_center[1] + circle_radius + 20
-    
-    draw.text((title_x, title_y), title_text, fill='#ffffff', font=title_font)
+    # Add "BrainDrive" text below the circle; it is unreadable on small renders
+    if size[0] >= 100:
+        title_font = _get_font(int(16 * scale))
+        
+        title_text = "BrainDrive"
+        title_bbox = draw.textbbox((0, 0), title_text, font=title_font)
+        title_width = title_bbox[2] - title_bbox[0]
+        title_x = size[0] // 2 - title_width // 2
+        title_y = circle_center[1] + circle_radius + int(20 * scale)
+        
+        draw.text((title_x, title_y), title_text, fill='#ffffff', font=title_font)
     
     return image
 
@@ -83,8 +87,8 @@ def main():
     logo.save('braindrive.png', 'PNG')
     print("✅ Created braindrive.png")
     
-    # Also create a smaller version for the card
-    small_logo = logo.resize((50, 50), Image.Resampling.LANCZOS)
+    # Also create a smaller version for the card, rendered at its own size
+    small_logo = create_braindrive_logo((50, 50))
     small_logo.save('braindrive_small.png', 'PNG')
     print("✅ Created braindrive_small.png")
     
@@ -7,22 +7,13 @@ This script generates version_info.txt used by PyInstaller for Windows builds.
 import os
 import sys
 from datetime import datetime
+from pathlib import Path
 
-def create_version_info():
-    """Create version_info.txt file for Windows executable metadata."""
-    
-    # Version information
-    version_major = 1
-    version_minor = 0
-    version_patch = 6
-    version_build = 0
-    
-    version_string = f"{version_major}.{version_minor}.{version_patch}.{version_build}"
-    
-    # Current year for copyright
-    current_year = datetime.now().year
-    
-    version_info_content = f'''# UTF-8
+# Single source for the default installer version (major, minor, patch, build)
+_DEFAULT_VERSION = (1, 0, 6, 0)
+
+# PyInstaller version resource; filled in with the version dict plus the copyright year
+_TEMPLATE = '''# UTF-8
 #
 # For more details about fixed file info 'ffi' see:
 # http://msdn.microsoft.com/en-us/library/ms646997.aspx
@@ -30,8 +21,8 @@ VSVersionInfo(
   ffi=FixedFileInfo(
     # filevers and prodvers should be always a tuple with four items: (1, 2, 3, 4)
     # Set not needed items to zero 0.
-    filevers=({version_major}, {version_minor}, {version_patch}, {version_build}),
-    prodvers=({version_major}, {version_minor}, {version_patch}, {version_build}),
+    filevers=({major}, {minor}, {patch}, {build}),
+    prodvers=({major}, {minor}, {patch}, {build}),
     # Contains a bitmask that specifies the valid bits 'flags'r
     mask=0x3f,
     # Contains a bitmask that specifies the Boolean attributes of the file.
@@ -55,33 +46,43 @@ VSVersionInfo(
         u'040904B0',
         [StringStruct(u'CompanyName', u'BrainDrive.ai'),
         StringStruct(u'FileDescription', u'BrainDrive Installer - Advanced AI Platform Installer'),
-        StringStruct(u'FileVersion', u'{version_string}'),
+        StringStruct(u'FileVersion', u'{string}'),
         StringStruct(u'InternalName', u'BrainDriveInstaller'),
-        StringStruct(u'LegalCopyright', u'Copyright © {current_year} BrainDrive.ai. All rights reserved.'),
+        StringStruct(u'LegalCopyright', u'Copyright © {year} BrainDrive.ai. All rights reserved.'),
         StringStruct(u'OriginalFilename', u'BrainDriveInstaller-win-x64.exe'),
         StringStruct(u'ProductName', u'BrainDrive Installer'),
-        StringStruct(u'ProductVersion', u'{version_string}'),
+        StringStruct(u'ProductVersion', u'{string}'),
         StringStruct(u'Comments', u'Cross-platform installer for BrainDrive AI platform with React frontend and FastAPI backend')])
       ]), 
     VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
   ]
 )'''
+
+def create_version_info(version=None):
+    """Create version_info.txt file for Windows executable metadata (default version unless given)."""
+    
+    # Version information
+    if version is None:
+        version = get_version_info()
+    
+    # Current year goes into the copyright line
+    version_info_content = _TEMPLATE.format_map({**version, 'year': datetime.now().year})
     
     # Write version info file
-    with open('version_info.txt', 'w', encoding='utf-8') as f:
-        f.write(version_info_content)
+    Path('version_info.txt').write_text(version_info_content, encoding='utf-8')
     
-    print(f"✅ Created version_info.txt with version {version_string}")
-    return version_string
+    print(f"✅ Created version_info.txt with version {version['string']}")
+    return version['string']
 
 def get_version_info():
     """Get current version information."""
+    major, minor, patch, build = _DEFAULT_VERSION
     return {
-        'major': 1,
-        'minor': 0,
-        'patch': 6,
-        'build': 0,
-        'string': '1.0.6.0'
+        'major': major,
+        'minor': minor,
+        'patch': patch,
+        'build': build,
+        'string': '.'.join(map(str, _DEFAULT_VERSION))
     }
 
 def update_version(major=None, minor=None, patch=None, build=None):
@@ -100,7 +101,7 @@ def update_version(major=None, minor=None, patch=None, build=None):
     current['string'] = f"{current['major']}.{current['minor']}.{current['patch']}.{current['build']}"
     
     print(f"🔄 Updating version to {current['string']}")
-    return create_version_info()
+    return create_version_info(current)
 
 if __name__ == '__main__':
     if len(sys.argv) > 1:
@@ -1,17 +1,19 @@
+import errno
+import functools
+import importlib.resources as resources
+import json
 import os
-import secrets
+import select
 import shutil
 import socket
 import stat
 import subprocess
-import threading
-import urllib.error
-import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
 import time
 import sys
 from pathlib import Path
-import importlib.resources as resources
 from braindrive_installer.core.base_installer import BaseInstaller
 from braindrive_installer.core.installer_state import InstallerState
 from braindrive_installer.core.platform_utils import PlatformUtils
@@ -24,10 +26,111 @@ from braindrive_installer.core.port_selector import (
     is_managed_port_pair,
     select_available_port_pair,
 )
+from braindrive_installer.utils.env_template import fill_template
 from braindrive_installer.utils.installer_bundle import sync_installer_bundle
 
 DEFAULT_BACKEND_PORT = DEFAULT_PORT_PAIRS[0][0]
 DEFAULT_FRONTEND_PORT = DEFAULT_PORT_PAIRS[0][1]
+# How long a passed check_requirements result is reused
+REQUIREMENTS_CACHE_SECONDS = 60
+# Anaconda channels whose Terms of Service must be accepted before conda installs
+_CONDA_TOS_CHANNELS = (
+    "https://repo.anaconda.com/pkgs/main",
+    "https://repo.anaconda.com/pkgs/r",
+    "https://repo.anaconda.com/pkgs/msys2",
+)
+# Console-hiding flags are fixed per platform; subprocess copies startupinfo per call
+_NO_WINDOW_FLAGS = PlatformUtils.create_no_window_flags()
+# Bytes of captured error output decoded for the failure message
+_ERROR_TAIL_BYTES = 8192
+# Worker threads for unlinking files when removing large trees (node_modules)
+_RMTREE_WORKERS = 16
+# Pauses between directory rename attempts while Windows scanners hold handles in a fresh tree
+_RENAME_RETRY_DELAYS = (0.1, 0.25, 0.5, 1.0)
+# Template file name -> content, or None if it was not found. Templates ship with the
+# installer and never change, so one lookup per process serves every installer instance
+_TEMPLATE_CACHE = {}
+
+def _combine_output(result):
+    """Join the stripped stdout and stderr of a completed process, skipping empty streams"""
+    return " | ".join(
+        stream for stream in ((result.stdout or "").strip(), (result.stderr or "").strip()) if stream
+    )
+
+def _is_reparse_point(entry):
+    """Return True for Windows junctions and other reparse points, which islink() misses."""
+    attributes = getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0)
+    return bool(attributes & getattr(stat, 'FILE_ATTRIBUTE_REPARSE_POINT', 0))
+
+# Host/URL helpers are pure and only ever see the few hosts in the settings, so they are cached
+@functools.lru_cache(maxsize=64)
+def _normalize_binding_host(host, allow_wildcard=False, default="localhost"):
+    """Normalize host strings for process bindings."""
+    if not host:
+        return default
+    host = host.strip()
+    if "://" in host:
+        parsed = urlparse(host)
+        host = parsed.hostname or default
+    if allow_wildcard:
+        return host or default
+    if host in ("0.0.0.0", "*"):
+        return default
+    return host or default
+
+@functools.lru_cache(maxsize=64)
+def _display_host(host):
+    """Convert binding host into a user-friendly address."""
+    if not host:
+        return "localhost"
+    host = host.strip()
+    if "://" in host:
+        parsed = urlparse(host)
+        host = parsed.hostname or host
+    if host in ("0.0.0.0", "*"):
+        return "127.0.0.1"
+    return host
+
+@functools.lru_cache(maxsize=64)
+def _service_url(host, port):
+    """Build an HTTP URL suitable for logging/service links."""
+    display_host = _display_host(host or "localhost")
+    port_part = f":{port}" if port else ""
+    return f"http://{display_host}{port_part}"
+
+@functools.lru_cache(maxsize=64)
+def _browser_url(host, port):
+    """Build a browser-friendly URL accounting for schemes in settings."""
+    if not host:
+        host = "localhost"
+    host = host.strip()
+    if "://" in host:
+        parsed = urlparse(host)
+        browse_host = parsed.hostname or _display_host(host)
+        scheme = parsed.scheme or "http"
+        effective_port = parsed.port or port
+        port_part = f":{effective_port}" if effective_port else ""
+        path = parsed.path or ""
+        return f"{scheme}://{browse_host}{port_part}{path}"
+
+    browse_host = _display_host(host)
+    port_part = f":{port}" if port else ""
+    return f"http://{browse_host}{port_part}"
+
+@functools.lru_cache(maxsize=64)
+def _normalize_path(path):
+    """Return the absolute form of path and the case-normalized key paths compare by."""
+    # The installer never changes directory, so relative paths resolve the same every time
+    absolute = os.path.abspath(path)
+    return absolute, os.path.normcase(absolute)
+
+@functools.lru_cache(maxsize=16)
+def _resolve_ipv4(host):
+    """Resolve host to an IPv4 literal once; name lookups of localhost can be slow on Windows."""
+    try:
+        return socket.gethostbyname(host)
+    except OSError:
+        return host
 
 class BrainDriveInstaller(BaseInstaller):
     """
@@ -62,6 +165,20 @@ class BrainDriveInstaller(BaseInstaller):
         self.env_name = "BrainDriveDev"
         self._refresh_paths()
         self.plugin_builder = PluginBuilder(self.plugins_path, status_updater)
+        # Resolved conda executable and PATH fallback, cached by _get_conda_executable
+        self._conda_cmd = None
+        self._conda_fallback = None
+        # (key, result) of the last check_installed and (timestamp, result) of check_requirements
+        self._check_installed_cache = (None, False)
+        self._requirements_checked_at = None
+        self._subprocess_kwargs = {"capture_output": True, "text": True, **_NO_WINDOW_FLAGS}
+        # Set when a stale conda environment was removed and created again
+        self._env_recreated = False
+        # Health endpoint that last answered, probed first by _wait_for_backend_ready
+        self._backend_ready_path = None
+        # Settings manager built by the last _load_settings, and the key it was loaded under
+        self._settings_manager = None
+        self._settings_cache_key = None
         
         # Server configuration - load from settings if available
         self._load_settings()
@@ -88,45 +205,78 @@ class BrainDriveInstaller(BaseInstaller):
         """
         Resolve absolute path to the bundled conda executable, with a fallback to PATH.
         """
+        if self._conda_cmd:
+            return self._conda_cmd
         conda_path = getattr(self.config, "conda_exe", None)
         if conda_path and os.path.exists(conda_path):
+            # Only a found bundled path short-circuits later calls; while it is missing it
+            # is checked again each time, as Miniconda may be installed after a fallback
+            self._conda_cmd = conda_path
             return conda_path
-        fallback = PlatformUtils.get_conda_executable_name()
+        if self._conda_fallback is None:
+            # Resolve against PATH once rather than on every spawn
+            fallback = PlatformUtils.get_conda_executable_name()
+            self._conda_fallback = shutil.which(fallback) or fallback
         self.logger.warning(
             "Conda executable not found at '%s'; falling back to '%s'.",
             conda_path,
-            fallback
+            self._conda_fallback
         )
-        return fallback
+        return self._conda_fallback
+
+    def _run_streaming(self, cmd, cwd=None, tail_lines=200):
+        """
+        Run a command, logging its combined output line by line as it arrives.
+        Only the last tail_lines lines are kept for error reporting.
+        """
+        tail = deque(maxlen=tail_lines)
+        with subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            errors="replace",
+            **_NO_WINDOW_FLAGS
+        ) as process:
+            for line in process.stdout:
+                line = line.rstrip()
+                if line:
+                    self.logger.info("  %s", line)
+                    tail.append(line)
+            returncode = process.wait()
+        return returncode, "\n".join(tail)
 
     def _ensure_conda_terms_accepted(self, conda_cmd: str) -> bool:
         """
         Ensure the required Anaconda channel Terms of Service are accepted.
         """
-        channels = [
-            "https://repo.anaconda.com/pkgs/main",
-            "https://repo.anaconda.com/pkgs/r",
-            "https://repo.anaconda.com/pkgs/msys2"
-        ]
+        channels = _CONDA_TOS_CHANNELS
+        # One conda start-up for every channel; --channel may be repeated
+        cmd = [conda_cmd, "tos", "accept", "--override-channels"]
+        for channel in channels:
+            cmd.extend(["--channel", channel])
+        try:
+            returncode, output = self._run_streaming(cmd)
+            if returncode == 0 or "already accepted" in output.casefold():
+                return True
+            self.logger.warning("Batched Conda ToS acceptance failed, retrying per channel: %s", output or "No output")
+        except Exception as exc:
+            self.logger.warning("Batched Conda ToS acceptance failed, retrying per channel: %s", exc)
+        return self._accept_conda_terms_per_channel(conda_cmd, channels)
+
+    def _accept_conda_terms_per_channel(self, conda_cmd: str, channels) -> bool:
+        """
+        Accept the Terms of Service one channel at a time, reporting the channel that fails.
+        """
         all_ok = True
+        cmd_prefix = (conda_cmd, "tos", "accept", "--override-channels", "--channel")
         for channel in channels:
-            cmd = [
-                conda_cmd,
-                "tos",
-                "accept",
-                "--override-channels",
-                "--channel",
-                channel
-            ]
             try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    **PlatformUtils.create_no_window_flags()
-                )
-                output = " ".join(filter(None, [(result.stdout or "").strip(), (result.stderr or "").strip()]))
-                if result.returncode != 0 and "already accepted" not in output.lower():
+                result = subprocess.run([*cmd_prefix, channel], **self._subprocess_kwargs)
+                output = _combine_output(result)
+                if result.returncode != 0 and "already accepted" not in output.casefold():
                     self.log_status(
                         f"Failed to accept Conda ToS for {channel}: {output or 'No output'}",
                         "error"
@@ -147,26 +297,52 @@ class BrainDriveInstaller(BaseInstaller):
         - Frontend dependencies installed
         - Configuration files exist
         """
+        # Adding or removing an entry bumps the directory mtime, so an unchanged key
+        # means the answer below cannot have changed
+        cache_key = self._install_cache_key()
+        cached_key, cached_result = self._check_installed_cache
+        if cache_key is not None and cache_key == cached_key:
+            if cached_result:
+                self._is_installed = True
+            return cached_result
+        
+        result = self._check_installed_uncached()
+        self._check_installed_cache = (cache_key, result)
+        return result
+
+    def _install_cache_key(self):
+        """Paths and directory mtimes that check_installed depends on, or None if unavailable."""
         try:
-            # Check if repository exists
-            if not os.path.exists(self.repo_path):
-                return False
-            
-            # Check if it's a valid git repository
-            if not self.git_manager.get_repository_status(self.repo_path):
+            return (
+                self.backend_path,
+                self.frontend_path,
+                os.stat(self.backend_path).st_mtime_ns,
+                os.stat(self.frontend_path).st_mtime_ns,
+            )
+        except OSError:
+            return None
+
+    def _invalidate_install_cache(self):
+        """Forget memoized check_installed/check_requirements results."""
+        self._check_installed_cache = (None, False)
+        self._requirements_checked_at = None
+
+    def _check_installed_uncached(self):
+        try:
+            # One directory read per side instead of a stat per file; a missing
+            # repository or backend/frontend directory means not installed
+            try:
+                backend_files, _ = self._scan_entries(self.backend_path)
+                frontend_files, frontend_dirs = self._scan_entries(self.frontend_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return False
             
             # Check backend setup
-            backend_requirements = os.path.join(self.backend_path, "requirements.txt")
-            backend_env = os.path.join(self.backend_path, ".env")
-            if not (os.path.exists(backend_requirements) and os.path.exists(backend_env)):
+            if not {"requirements.txt", ".env"} <= backend_files:
                 return False
             
             # Check frontend setup
-            frontend_package = os.path.join(self.frontend_path, "package.json")
-            frontend_env = os.path.join(self.frontend_path, ".env")
-            frontend_modules = os.path.join(self.frontend_path, "node_modules")
-            if not (os.path.exists(frontend_package) and os.path.exists(frontend_env) and os.path.exists(frontend_modules)):
+            if not {"package.json", ".env"} <= frontend_files or "node_modules" not in frontend_dirs:
                 return False
             
             self._is_installed = True
@@ -176,6 +352,25 @@ class BrainDriveInstaller(BaseInstaller):
             self.log_status(f"Error checking installation: {str(e)}", "error")
             return False
 
+    @staticmethod
+    def _scan_entries(path):
+        """
+        List a directory once, splitting entry names into files and directories.
+        
+        Returns:
+            Tuple of (file names, directory names)
+        """
+        files = set()
+        dirs = set()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # DirEntry caches the type from the directory read; symlinks are followed
+                if entry.is_dir():
+                    dirs.add(entry.name)
+                elif entry.is_file():
+                    files.add(entry.name)
+        return files, dirs
+
     def check_requirements(self):
         """
         Check if all pre-installation requirements are met:
@@ -185,6 +380,11 @@ class BrainDriveInstaller(BaseInstaller):
         Note: Git and Node.js are installed by the conda environment setup,
         so we don't require them to be pre-installed.
         """
+        # Tool availability rarely changes mid-session; reuse a recent pass (failures are rechecked)
+        checked_at = self._requirements_checked_at
+        if checked_at is not None and time.monotonic() - checked_at < REQUIREMENTS_CACHE_SECONDS:
+            return True
+        
         try:
             requirements_status = self.get_system_requirements_status()
             
@@ -203,6 +403,7 @@ class BrainDriveInstaller(BaseInstaller):
                 self.log_status(error_msg, "error")
                 return False
             
+            self._requirements_checked_at = time.monotonic()
             return True
             
         except Exception as e:
@@ -234,19 +435,11 @@ class BrainDriveInstaller(BaseInstaller):
             
             self.log_status("Creating conda environment with Python 3.11, Node.js, and Git...", "info")
             
-            result = subprocess.run(
-                create_cmd,
-                capture_output=True,
-                text=True,
-                **PlatformUtils.create_no_window_flags()
-            )
+            returncode, output = self._run_streaming(create_cmd)
             
-            if result.returncode != 0:
-                stdout = (result.stdout or "").strip()
-                stderr = (result.stderr or "").strip()
-                combined = " | ".join(filter(None, [stdout, stderr])) or "No output"
+            if returncode != 0:
                 self.log_status(
-                    f"Failed to create environment (exit {result.returncode}): {combined}",
+                    f"Failed to create environment (exit {returncode}): {output or 'No output'}",
                     "error"
                 )
                 return False
@@ -275,14 +468,12 @@ class BrainDriveInstaller(BaseInstaller):
             self.create_directory_safely(parent_dir)
             
             # Clone repository - git_manager returns (success, error_message)
-            success, error_message = self.git_manager.clone_repository(repo_url, target_path, branch)
+            success, error_message = self.git_manager.clone_repository(repo_url, target_path, branch, shallow=True)
             
             if success:
-                self.logger.info("Repository cloning completed successfully")
                 self.log_status("Successfully cloned BrainDrive repository", "info")
                 return True
             else:
-                self.logger.error(f"Repository cloning failed: {error_message}")
                 self.log_status(f"Failed to clone BrainDrive repository: {error_message}", "error")
                 return False
                 
@@ -303,20 +494,69 @@ class BrainDriveInstaller(BaseInstaller):
                 self.log_status("No plugins directory found, skipping plugin build", "info")
                 return True
             
-            # Build all plugins
-            success = self.plugin_builder.build_all_plugins()
+            # Build all plugins, several at a time
+            success, results = self.plugin_builder.build_all_plugins(parallel=True)
             
             if success:
                 self.log_status("Successfully built all plugins", "info")
-                return True
             else:
-                self.log_status("Failed to build some plugins", "error")
-                return False
+                # A plugin that fails to build does not stop the installation
+                failed = ", ".join(results.get("failed_plugins", [])) or results.get("error", "unknown")
+                self.log_status(f"Some plugins failed to build: {failed}", "warning")
+            return True
                 
         except Exception as e:
             self.log_status(f"Error building plugins: {str(e)}", "error")
             return False
 
+    def _recreate_environment(self):
+        """
+        Remove a stale conda environment and create it again.
+
+        Returns:
+            bool: True if the environment was recreated
+        """
+        self.log_status(
+            f"Detected stale {self.env_name} environment; recreating...",
+            "warning"
+        )
+        cleanup_result = subprocess.run(
+            [self._get_conda_executable(), "env", "remove", "--prefix", self.env_prefix, "-y"],
+            **self._subprocess_kwargs
+        )
+        cleanup_output = _combine_output(cleanup_result) or "No output"
+        if cleanup_result.returncode != 0:
+            self.log_status(
+                f"Failed to remove stale environment: {cleanup_output}",
+                "error"
+            )
+            return False
+        self.log_status("Removed stale environment; recreating...", "warning")
+        if not self.setup_environment(self.env_name):
+            return False
+        self._env_recreated = True
+        return True
+
+    def _validate_environment(self):
+        """
+        Make sure conda can run commands in the environment, recreating it if it is stale.
+
+        Returns:
+            bool: False only if a stale environment could not be recreated
+        """
+        try:
+            result = subprocess.run(
+                [self._get_conda_executable(), "run", "--prefix", self.env_prefix, "python", "--version"],
+                **self._subprocess_kwargs
+            )
+        except OSError as e:
+            # The setup steps report a conda that cannot be started themselves
+            self.logger.warning(f"Could not validate conda environment: {e}")
+            return True
+        if "EnvironmentLocationNotFound" in _combine_output(result):
+            return self._recreate_environment()
+        return True
+
     def setup_backend(self):
         """
         Set up BrainDrive backend:
@@ -327,74 +567,63 @@ class BrainDriveInstaller(BaseInstaller):
             self.log_status("Setting up BrainDrive backend...", "info")
             
             # Check if backend directory exists
-            if not os.path.exists(self.backend_path):
+            if not os.path.isdir(self.backend_path):
                 self.log_status("Backend directory not found", "error")
                 return False
             
             # Install Python dependencies
-            requirements_file = os.path.join(self.backend_path, "requirements.txt")
-            if os.path.exists(requirements_file):
+            requirements_file = self.backend_requirements_path
+            if os.path.isfile(requirements_file):
                 self.log_status("Installing backend dependencies...", "info")
                 
-                # Use conda environment pip
-                conda_cmd = self._get_conda_executable()
-                pip_cmd = [
-                    conda_cmd,
-                    "run",
-                    "--prefix",
-                    self.env_prefix,
-                    "pip",
-                    "install",
-                    "-r",
-                    requirements_file
-                ]
-                
-                result = subprocess.run(
-                    pip_cmd,
-                    cwd=self.backend_path,
-                    capture_output=True,
-                    text=True,
-                    **PlatformUtils.create_no_window_flags()
-                )
-                
-                if result.returncode != 0:
-                    stdout = (result.stdout or "").strip()
-                    stderr = (result.stderr or "").strip()
-                    combined = " | ".join(filter(None, [stdout, stderr])) or "No output"
+                def _run_pip():
+                    """Run the pip install once, returning (ok, needs_recreate)"""
+                    # --live-stream hands pip output through as it is produced; the pip
+                    # flags skip its version check and any interactive prompt
+                    pip_cmd = [
+                        self._get_conda_executable(),
+                        "run",
+                        "--live-stream",
+                        "--prefix",
+                        self.env_prefix,
+                        "pip",
+                        "install",
+                        "--disable-pip-version-check",
+                        "--no-input",
+                        "-r",
+                        requirements_file
+                    ]
+                    returncode, output = self._run_streaming(pip_cmd, cwd=self.backend_path)
+                    if returncode == 0:
+                        return True, False
+                    combined = output or "No output"
                     if "EnvironmentLocationNotFound" in combined:
-                        self.log_status(
-                            "Detected stale BrainDriveDev environment; recreating...",
-                            "warning"
-                        )
-                        cleanup_result = subprocess.run(
-                            [conda_cmd, "env", "remove", "--prefix", self.env_prefix, "-y"],
-                            capture_output=True,
-                            text=True,
-                            **PlatformUtils.create_no_window_flags()
-                        )
-                        cleanup_output = " | ".join(filter(None, [(cleanup_result.stdout or "").strip(), (cleanup_result.stderr or "").strip()])) or "No output"
-                        if cleanup_result.returncode != 0:
-                            self.log_status(
-                                f"Failed to remove stale environment: {cleanup_output}",
-                                "error"
-                            )
-                            return False
-                        self.log_status("Removed stale environment; recreating...", "warning")
-                        if not self.setup_environment(self.env_name):
-                            return False
-                        return self.setup_backend()
-                    
+                        return False, True
                     self.log_status(
                         f"Failed to install backend dependencies: {combined}",
                         "error"
                     )
+                    return False, False
+
+                ok, needs_recreate = _run_pip()
+                if needs_recreate:
+                    if not self._recreate_environment():
+                        return False
+                    # Only the pip step is repeated; a second stale environment is an error
+                    ok, needs_recreate = _run_pip()
+                    if needs_recreate:
+                        self.log_status(
+                            "Failed to install backend dependencies: environment still not found",
+                            "error"
+                        )
+                if not ok:
                     return False
                 
                 self.log_status("Backend dependencies installed successfully", "info")
             
             # Create backend .env file
-            backend_env_path = os.path.join(self.backend_path, ".env")
-            if not os.path.exists(backend_env_path):
+            backend_env_path = self.backend_env_path
+            if not os.path.isfile(backend_env_path):
                 self.log_status("Creating backend .env file...", "info")
                 success = self._create_backend_env_file(backend_env_path)
                 if not success:
@@ -417,13 +646,13 @@ class BrainDriveInstaller(BaseInstaller):
             self.log_status("Setting up BrainDrive frontend...", "info")
             
             # Check if frontend directory exists
-            if not os.path.exists(self.frontend_path):
+            if not os.path.isdir(self.frontend_path):
                 self.log_status("Frontend directory not found", "error")
                 return False
             
             # Install npm dependencies using conda environment
-            package_json = os.path.join(self.frontend_path, "package.json")
-            if os.path.exists(package_json):
+            package_json = self.frontend_package_path
+            if os.path.isfile(package_json):
                 self.log_status("Installing frontend dependencies...", "info")
                 
                 # Use conda run to execute npm in the correct environment
@@ -436,16 +665,17 @@ class BrainDriveInstaller(BaseInstaller):
                 
                 try:
                     import subprocess
+                    # npm output is only read on failure; keep it as bytes and decode the tail
                     result = subprocess.run(
                         npm_install_cmd,
                         cwd=self.frontend_path,
                         capture_output=True,
-                        text=True,
                         timeout=900,  # 15 minutes
-                        **PlatformUtils.create_no_window_flags()
+                        **_NO_WINDOW_FLAGS
                     )
                     if result.returncode != 0:
-                        self.log_status(f"Failed to install frontend dependencies: {result.stderr}", "error")
+                        stderr_tail = result.stderr[-_ERROR_TAIL_BYTES:].decode("utf-8", errors="replace")
+                        self.log_status(f"Failed to install frontend dependencies: {stderr_tail}", "error")
                         return False
                 except subprocess.TimeoutExpired:
                     self.log_status("npm install timed out", "error")
@@ -457,8 +687,8 @@ class BrainDriveInstaller(BaseInstaller):
                 self.log_status("Frontend dependencies installed successfully", "info")
             
             # Create frontend .env file
-            frontend_env_path = os.path.join(self.frontend_path, ".env")
-            if not os.path.exists(frontend_env_path):
+            frontend_env_path = self.frontend_env_path
+            if not os.path.isfile(frontend_env_path):
                 self.log_status("Creating frontend .env file...", "info")
                 success = self._create_frontend_env_file(frontend_env_path)
                 if not success:
@@ -486,27 +716,23 @@ class BrainDriveInstaller(BaseInstaller):
             
             # Check if already installed
             if self.check_installed():
-                self.logger.info("BrainDrive is already installed, skipping installation")
                 self.log_status("BrainDrive is already installed", "info")
                 install_success = True
                 return True
             
             # Step 1: Check requirements
-            self.logger.info("Step 1/7: Checking system requirements")
             self.log_status("Step 1/7: Checking system requirements...", "info")
             if not self.check_requirements():
                 self.logger.error("System requirements check failed")
                 return False
             
             # Step 2: Setup conda environment
-            self.logger.info("Step 2/7: Setting up conda environment")
             self.log_status("Step 2/7: Setting up conda environment...", "info")
             if not self.setup_environment(self.env_name):
                 self.logger.error("Conda environment setup failed")
                 return False
             
             # Step 3: Clone repository
-            self.logger.info("Step 3/7: Cloning BrainDrive repository")
             self.log_status("Step 3/7: Cloning BrainDrive repository...", "info")
             staging_path = self._create_staging_path("install")
             if not self.clone_repository(target_path=staging_path):
@@ -527,36 +753,50 @@ class BrainDriveInstaller(BaseInstaller):
             self._apply_preinstall_settings_if_present()
             
             # Step 4: Build plugins
-            self.logger.info("Step 4/7: Building plugins")
             self.log_status("Step 4/7: Building plugins...", "info")
             if not self.build_plugins():
                 self.logger.error("Plugin building failed")
                 return False
             
-            # Step 5: Setup backend
-            self.logger.info("Step 5/7: Setting up backend")
+            # Steps 5-6: pip and npm installs are independent downloads, so run them together.
+            # Both run inside the conda environment; settle it first so neither step can
+            # have it removed and recreated underneath the other
+            if not self._validate_environment():
+                self.logger.error("Conda environment validation failed")
+                return False
+            self._env_recreated = False
             self.log_status("Step 5/7: Setting up backend...", "info")
-            if not self.setup_backend():
+            self.log_status("Step 6/7: Setting up frontend...", "info")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                backend_future = executor.submit(self.setup_backend)
+                frontend_future = executor.submit(self.setup_frontend)
+                backend_ok = backend_future.result()
+                frontend_ok = frontend_future.result()
+            
+            if not backend_ok:
                 self.logger.error("Backend setup failed")
                 return False
             
-            # Step 6: Setup frontend
-            self.logger.info("Step 6/7: Setting up frontend")
-            self.log_status("Step 6/7: Setting up frontend...", "info")
-            if not self.setup_frontend():
-                self.logger.error("Frontend setup failed")
-                return False
+            if not frontend_ok:
+                # npm may have run against the environment the backend had to recreate;
+                # any other frontend failure is final
+                if not self._env_recreated:
+                    self.logger.error("Frontend setup failed")
+                    return False
+                self.log_status("Retrying frontend setup in the recreated environment...", "warning")
+                if not self.setup_frontend():
+                    self.logger.error("Frontend setup failed")
+                    return False
             
             # Step 7: Verify installation
-            self.logger.info("Step 7/7: Verifying installation")
             self.log_status("Step 7/7: Verifying installation...", "info")
             if not self.check_installed():
-                self.logger.error("Installation verification failed")
                 self.log_status("Installation verification failed", "error")
                 return False
             
             self.logger.info("=== BRAINDRIVE INSTALLATION COMPLETED SUCCESSFULLY ===")
             self.log_status("BrainDrive installation completed successfully!", "info")
+            self._invalidate_install_cache()
             self._is_installed = True
             InstallerState.set_install_path(self.config.base_path)
             try:
@@ -613,7 +853,8 @@ class BrainDriveInstaller(BaseInstaller):
                 success, error_msg = self.process_manager.start_process(
                     "braindrive_backend",
                     backend_cmd,
-                    cwd=self.backend_path
+                    cwd=self.backend_path,
+                    readiness_port=self.backend_port
                 )
 
                 if not success:
@@ -643,7 +884,8 @@ class BrainDriveInstaller(BaseInstaller):
                 success, error_msg = self.process_manager.start_process(
                     "braindrive_frontend",
                     frontend_cmd,
-                    cwd=self.frontend_path
+                    cwd=self.frontend_path,
+                    readiness_port=self.frontend_port
                 )
 
                 if not success:
@@ -673,6 +915,7 @@ class BrainDriveInstaller(BaseInstaller):
         stop_success = False
         try:
             self.log_status("Stopping BrainDrive services...", "info")
+            self._invalidate_install_cache()
             
             # STEP 1: Try to stop processes through ProcessManager (normal way)
             self.log_status("Step 1: Attempting normal process stop...", "info")
@@ -684,12 +927,10 @@ class BrainDriveInstaller(BaseInstaller):
             # STEP 2: Double-check if processes are actually stopped
             self.log_status("Step 2: Verifying processes are actually stopped...", "info")
             
-            # Wait a moment for processes to fully terminate
-            time.sleep(2)
-            
-            # Check if ports are actually free
-            backend_port_free = self._check_port_free(self.backend_port)
-            frontend_port_free = self._check_port_free(self.frontend_port)
+            # Wait for the ports to be released, but no longer than needed
+            backend_port_free, frontend_port_free = self._wait_for_ports_free(
+                (self.backend_port, self.frontend_port), timeout=2.0
+            )
 
             self.log_status(f"Port status - Backend ({self.backend_port}): {'FREE' if backend_port_free else 'IN USE'}, Frontend ({self.frontend_port}): {'FREE' if frontend_port_free else 'IN USE'}", "info")
             
@@ -717,28 +958,25 @@ class BrainDriveInstaller(BaseInstaller):
                     "BrainDriveInstaller\\node.exe"
                 ]
                 
-                # Kill backend processes
+                # Only target the servers whose port is still held; one scan covers both
+                kill_groups = {}
                 if not backend_port_free:
-                    backend_killed = self.process_manager.kill_processes_by_pattern(
-                        backend_patterns, "backend processes"
-                    )
-                    self.log_status(f"Backup cleanup killed {backend_killed} backend processes", "info")
-                
-                # Kill frontend processes
+                    kill_groups["backend processes"] = backend_patterns
                 if not frontend_port_free:
-                    frontend_killed = self.process_manager.kill_processes_by_pattern(
-                        frontend_patterns, "frontend processes"
-                    )
-                    self.log_status(f"Backup cleanup killed {frontend_killed} frontend processes", "info")
+                    kill_groups["frontend processes"] = frontend_patterns
+                killed = self.process_manager.kill_processes_by_patterns(kill_groups)
+                for description, killed_count in killed.items():
+                    self.log_status(f"Backup cleanup killed {killed_count} {description}", "info")
                 
-                # Wait for cleanup to take effect
-                time.sleep(3)
+                # Wait for cleanup to take effect, returning as soon as both ports are released
+                self._wait_for_ports_free((self.backend_port, self.frontend_port), timeout=3.0)
             
             # STEP 4: Final verification
             self.log_status("Step 4: Final verification...", "info")
             
-            final_backend_free = self._check_port_free(self.backend_port)
-            final_frontend_free = self._check_port_free(self.frontend_port)
+            final_backend_free, final_frontend_free = self._check_ports_free(
+                self.backend_port, self.frontend_port
+            )
 
             self.log_status(f"Final port status - Backend ({self.backend_port}): {'FREE' if final_backend_free else 'STILL IN USE'}, Frontend ({self.frontend_port}): {'FREE' if final_frontend_free else 'STILL IN USE'}", "info")
             
@@ -763,6 +1001,46 @@ class BrainDriveInstaller(BaseInstaller):
             outcome_text = "completed successfully" if stop_success else "ended with errors"
             self.logger.info(f"BrainDrive service stop {outcome_text} in {elapsed:.2f} seconds")
     
+    def _wait_for_ports_free(self, ports, timeout: float) -> list:
+        """
+        Poll ports with exponential backoff until all are free or the timeout expires.
+        
+        Args:
+            ports: Port numbers to check
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            List of free flags, in the order of ports
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        free = [False] * len(ports)
+        while True:
+            # A port that has been released stays released; only re-check the busy ones
+            busy = [index for index, is_free in enumerate(free) if not is_free]
+            for index, is_free in zip(busy, self._check_ports_free(*(ports[i] for i in busy))):
+                free[index] = is_free
+            remaining = deadline - time.monotonic()
+            if all(free) or remaining <= 0:
+                return free
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.32)
+
+    def _check_ports_free(self, *ports) -> list:
+        """
+        Check several ports concurrently so their connect timeouts overlap.
+        
+        Args:
+            ports: Port numbers to check
+            
+        Returns:
+            List of free flags, in the order of ports
+        """
+        if len(ports) < 2:
+            return [self._check_port_free(port) for port in ports]
+        with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+            return list(executor.map(self._check_port_free, ports))
+
     def _check_port_free(self, port: int) -> bool:
         """
         Check if a port is free (not in use).
@@ -773,12 +1051,18 @@ class BrainDriveInstaller(BaseInstaller):
         Returns:
             True if port is free, False if in use
         """
-        import socket
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex(('localhost', port))
-            sock.close()
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                # Start the connect without blocking and wait for it to settle. Loopback
+                # connects are accepted or refused at once; a probe that a firewall drops
+                # gives up after 50 ms. Windows reports a refused connect as exceptional
+                sock.setblocking(False)
+                result = sock.connect_ex((_resolve_ipv4('localhost'), port))
+                if result != 0:
+                    _, writable, failed = select.select([], [sock], [sock], 0.05)
+                    if not writable and not failed:
+                        return True  # No answer in time; treat as free
+                    result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
             return result != 0  # Port is free if connection failed
         except Exception:
             return True  # Assume free if we can't check
@@ -824,43 +1108,48 @@ class BrainDriveInstaller(BaseInstaller):
                 self.log_status("Backend template not found in packaged resources.", "error")
                 return False
             
-            # Generate secret key
+            # Generate secret key; secrets pulls in hashlib and hmac, so it is
+            # imported only when an .env file is actually written
+            import secrets
             secret_key = secrets.token_urlsafe(32)
             
-            # Replace template variables
-            env_content = template_content.replace("{BACKEND_HOST}", "0.0.0.0")
-            env_content = env_content.replace("{BACKEND_PORT}", str(self.backend_port))
-            env_content = env_content.replace("{FRONTEND_HOST}", self.frontend_host)
-            env_content = env_content.replace("{FRONTEND_PORT}", str(self.frontend_port))
-            env_content = env_content.replace("{SECRET_KEY}", secret_key)
-            env_content = env_content.replace("{LOG_LEVEL}", "info")
-            env_content = env_content.replace("{DATABASE_PATH}", "sqlite:///braindrive.db")
-            env_content = env_content.replace("{DEBUG_MODE}", "false")
-            env_content = env_content.replace("{ENABLE_REGISTRATION}", "true")
-            env_content = env_content.replace("{ENABLE_API_DOCS}", "true")
-            env_content = env_content.replace("{ENABLE_METRICS}", "false")
-            env_content = env_content.replace("{WORKER_COUNT}", "1")
-            env_content = env_content.replace("{MAX_UPLOAD_SIZE}", "100000000")
-            
-            # Generate CORS origins and allowed hosts
-            cors_origins = [
+            # Generate CORS origins and allowed hosts; dict.fromkeys drops duplicates
+            # (e.g. a localhost frontend) while keeping the order stable
+            cors_origins = list(dict.fromkeys([
                 f"http://{self.frontend_host}:{self.frontend_port}",
                 f"http://127.0.0.1:{self.frontend_port}",
                 f"http://localhost:{self.frontend_port}"
-            ]
-            allowed_hosts = [
+            ]))
+            allowed_hosts = list(dict.fromkeys([
                 "0.0.0.0",
                 self.frontend_host,
                 "localhost",
                 "127.0.0.1"
-            ]
-            
-            env_content = env_content.replace("{CORS_ORIGINS}", str(cors_origins).replace("'", '"'))
-            env_content = env_content.replace("{ALLOWED_HOSTS}", str(list(set(allowed_hosts))).replace("'", '"'))
+            ]))
             
-            # Write the processed content to the .env file
-            with open(env_path, 'w', encoding='utf-8') as f:
-                f.write(env_content)
+            # Replace template variables
+            env_content = fill_template(template_content, {
+                "BACKEND_HOST": "0.0.0.0",
+                "BACKEND_PORT": self.backend_port,
+                "FRONTEND_HOST": self.frontend_host,
+                "FRONTEND_PORT": self.frontend_port,
+                "SECRET_KEY": secret_key,
+                "LOG_LEVEL": "info",
+                "DATABASE_PATH": "sqlite:///braindrive.db",
+                "DEBUG_MODE": "false",
+                "ENABLE_REGISTRATION": "true",
+                "ENABLE_API_DOCS": "true",
+                "ENABLE_METRICS": "false",
+                "WORKER_COUNT": "1",
+                "MAX_UPLOAD_SIZE": "100000000",
+                "CORS_ORIGINS": json.dumps(cors_origins),
+                "ALLOWED_HOSTS": json.dumps(allowed_hosts),
+            })
+            
+            # Write the processed content to the .env file; templates use LF line endings
+            env_file = Path(env_path)
+            env_file.parent.mkdir(parents=True, exist_ok=True)
+            env_file.write_text(env_content, encoding='utf-8', newline='\n')
             
             self.log_status("Backend .env file created successfully from template", "info")
             return True
@@ -880,12 +1169,15 @@ class BrainDriveInstaller(BaseInstaller):
                 return False
             
             # Load optional settings for richer template substitution
-            settings_manager = None
-            try:
-                from braindrive_installer.ui.settings_manager import BrainDriveSettingsManager
-                settings_manager = BrainDriveSettingsManager(self.repo_path)
-            except Exception:
-                settings_manager = None
+            # Only settings are read here, and every manager reads the same settings
+            # file, so the one _load_settings built can be reused
+            settings_manager = self._settings_manager
+            if settings_manager is None:
+                try:
+                    from braindrive_installer.ui.settings_manager import BrainDriveSettingsManager
+                    settings_manager = BrainDriveSettingsManager(self.repo_path)
+                except Exception:
+                    settings_manager = None
 
             backend_host = getattr(self, "backend_host", None)
             backend_port = getattr(self, "backend_port", None)
@@ -922,18 +1214,21 @@ class BrainDriveInstaller(BaseInstaller):
             default_theme = default_theme or "light"
             
             # Replace template variables
-            env_content = template_content.replace("{BACKEND_HOST}", str(backend_host))
-            env_content = env_content.replace("{BACKEND_PORT}", str(backend_port))
-            env_content = env_content.replace("{FRONTEND_HOST}", str(frontend_host))
-            env_content = env_content.replace("{FRONTEND_PORT}", str(frontend_port))
-            env_content = env_content.replace("{ENABLE_PWA}", enable_pwa_str)
-            env_content = env_content.replace("{ENABLE_ANALYTICS}", enable_analytics_str)
-            env_content = env_content.replace("{DEBUG_MODE}", debug_mode_str)
-            env_content = env_content.replace("{DEFAULT_THEME}", default_theme)
-            
-            # Write the processed content to the .env file
-            with open(env_path, 'w', encoding='utf-8') as f:
-                f.write(env_content)
+            env_content = fill_template(template_content, {
+                "BACKEND_HOST": backend_host,
+                "BACKEND_PORT": backend_port,
+                "FRONTEND_HOST": frontend_host,
+                "FRONTEND_PORT": frontend_port,
+                "ENABLE_PWA": enable_pwa_str,
+                "ENABLE_ANALYTICS": enable_analytics_str,
+                "DEBUG_MODE": debug_mode_str,
+                "DEFAULT_THEME": default_theme,
+            })
+            
+            # Write the processed content to the .env file; templates use LF line endings
+            env_file = Path(env_path)
+            env_file.parent.mkdir(parents=True, exist_ok=True)
+            env_file.write_text(env_content, encoding='utf-8', newline='\n')
             
             self.log_status("Frontend .env file created successfully from template", "info")
             return True
@@ -1001,8 +1296,31 @@ class BrainDriveInstaller(BaseInstaller):
                     self.logger.warning("Failed to refresh env files after auto-selecting ports: %s", exc)
         return True
 
+    def _settings_key(self, settings_file):
+        """Install state, repo path and settings file mtime that _load_settings depends on."""
+        installed = False
+        try:
+            installed = self.check_installed()
+        except Exception:
+            installed = False
+
+        try:
+            mtime = os.stat(settings_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        return (installed, self.repo_path, settings_file, mtime)
+
     def _load_settings(self):
         """Load settings from JSON file if available, otherwise use defaults"""
+        # Nothing the settings were read from has changed; skip the JSON parse and port probes
+        manager = self._settings_manager
+        if manager is not None and self._settings_key(manager.settings_file) == self._settings_cache_key:
+            return
+
+        self._settings_cache_key = None
+        self._conda_cmd = None
+        self._conda_fallback = None
+        
         # Default values
         self.backend_port = DEFAULT_BACKEND_PORT
         self.frontend_port = DEFAULT_FRONTEND_PORT
@@ -1012,8 +1330,6 @@ class BrainDriveInstaller(BaseInstaller):
         
         try:
             from braindrive_installer.ui.settings_manager import BrainDriveSettingsManager
-            repo_manager = BrainDriveSettingsManager(self.repo_path)
-            preinstall_manager = BrainDriveSettingsManager(self.config.env_path)
             active_manager = None
             source_label = "defaults"
 
@@ -1023,7 +1339,8 @@ class BrainDriveInstaller(BaseInstaller):
             except Exception:
                 installed = False
 
-            manager = repo_manager if installed else preinstall_manager
+            # Both locations share one settings file; only build (and parse) the manager in use
+            manager = BrainDriveSettingsManager(self.repo_path if installed else self.config.env_path)
             active_manager = manager
 
             self.backend_port = manager.get_setting('network', 'backend_port', DEFAULT_BACKEND_PORT)
@@ -1033,8 +1350,10 @@ class BrainDriveInstaller(BaseInstaller):
             self.debug_mode = manager.get_setting('security', 'debug_mode', False)
             install_base = manager.get_setting('installation', 'path', self.config.base_path)
             self._adopt_install_path_from_settings(install_base, require_repo=installed)
+            # After adoption, which may change paths and reset the cached manager
+            self._settings_manager = manager
 
-            settings_file = repo_manager.settings_file
+            settings_file = manager.settings_file
             if os.path.exists(settings_file):
                 source_label = "repo JSON" if installed else "pre-install JSON"
             else:
@@ -1059,6 +1378,8 @@ class BrainDriveInstaller(BaseInstaller):
                 f"Loaded settings from {source_label}: Backend {self.backend_host}:{self.backend_port}, "
                 f"Frontend {self.frontend_host}:{self.frontend_port}"
             )
+            # Taken last so settings saved above count as already loaded
+            self._settings_cache_key = self._settings_key(settings_file)
 
         except Exception as e:
             self.logger.warning(f"Could not load settings, using defaults: {e}")
@@ -1071,14 +1392,14 @@ class BrainDriveInstaller(BaseInstaller):
         """Create a unique staging directory for cloning operations."""
         parent_dir = os.path.dirname(self.repo_path)
         os.makedirs(parent_dir, exist_ok=True)
-        suffix = secrets.token_hex(4)
+        suffix = os.urandom(4).hex()
         return os.path.join(parent_dir, f".braindrive_{purpose}_staging_{suffix}")
 
     def _create_backup_path(self):
         """Generate a path for storing the previous installation during updates."""
         parent_dir = os.path.dirname(self.repo_path)
         os.makedirs(parent_dir, exist_ok=True)
-        suffix = secrets.token_hex(4)
+        suffix = os.urandom(4).hex()
         return os.path.join(parent_dir, f".braindrive_backup_{suffix}")
 
     def _cleanup_directory(self, path):
@@ -1088,10 +1409,54 @@ class BrainDriveInstaller(BaseInstaller):
 
         try:
             PlatformUtils.ensure_writable(path)
-            shutil.rmtree(path, onerror=self._handle_remove_readonly)
+            try:
+                self._parallel_rmtree(path)
+            except OSError as exc:
+                # Whatever the fast path left behind (junctions, locked files) goes the slow way
+                self.logger.debug("Parallel removal of %s incomplete, falling back: %s", path, exc)
+                if os.path.lexists(path):
+                    shutil.rmtree(path, onerror=self._handle_remove_readonly)
         except Exception as exc:
             self.logger.warning(f"Failed to cleanup directory {path}: {exc}")
 
+    def _parallel_rmtree(self, path):
+        """
+        Remove a directory tree, unlinking its files on a thread pool.
+        
+        Unlinks dominate removal of trees with many small files; they are issued
+        concurrently, then the emptied directories are removed bottom-up.
+        """
+        files = []
+        dirs = []
+        pending = [path]
+        while pending:
+            dir_path = pending.pop()
+            dirs.append(dir_path)
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and not _is_reparse_point(entry):
+                        pending.append(entry.path)
+                    else:
+                        # Symlinks and Windows junctions are unlinked, never entered:
+                        # npm links node_modules entries to trees outside this one
+                        files.append(entry.path)
+
+        with ThreadPoolExecutor(max_workers=_RMTREE_WORKERS) as executor:
+            # list() re-raises the first failure once every unlink has been attempted
+            list(executor.map(self._unlink_writable, files))
+        # Parents were collected before their children
+        for dir_path in reversed(dirs):
+            os.rmdir(dir_path)
+
+    @staticmethod
+    def _unlink_writable(path):
+        """Unlink a file, clearing a read-only flag first if the OS refuses."""
+        try:
+            os.unlink(path)
+        except PermissionError:
+            os.chmod(path, stat.S_IWRITE)
+            os.unlink(path)
+
     def _handle_remove_readonly(self, func, path, exc_info):
         """Callback for shutil.rmtree to clear read-only flags and retry."""
         try:
@@ -1101,7 +1466,13 @@ class BrainDriveInstaller(BaseInstaller):
             self.logger.warning(f"Failed to remove read-only path {path}: {exc}")
 
     def _load_template_content(self, filename: str):
-        """Load template content from package resources or bundled data paths."""
+        """Load template content, searching for each template at most once per process."""
+        if filename not in _TEMPLATE_CACHE:
+            _TEMPLATE_CACHE[filename] = self._read_template_content(filename)
+        return _TEMPLATE_CACHE[filename]
+
+    def _read_template_content(self, filename: str):
+        """Read template content from package resources or bundled data paths."""
         checked_paths = []
 
         # Try Python package resources first.
@@ -1111,7 +1482,7 @@ class BrainDriveInstaller(BaseInstaller):
             if template_file.is_file():
                 return template_file.read_text(encoding='utf-8')
         except Exception as exc:
-            self.logger.debug(f"Template {filename} not found in package resources: {exc}")
+            self.logger.debug("Template %s not found in package resources: %s", filename, exc)
 
         # Fallback search paths for PyInstaller data directories and development tree.
         candidate_roots = [
@@ -1139,15 +1510,19 @@ class BrainDriveInstaller(BaseInstaller):
 
     def _validate_repository_structure(self, repo_root):
         """Ensure the cloned repository contains the expected structure."""
-        expected_items = [
-            os.path.join(repo_root, "backend"),
-            os.path.join(repo_root, "frontend"),
-            os.path.join(repo_root, "backend", "requirements.txt"),
-            os.path.join(repo_root, "frontend", "package.json")
+        expected_files = [
+            ("backend", "requirements.txt"),
+            ("frontend", "package.json")
         ]
 
-        for item in expected_items:
-            if not os.path.exists(item):
+        # A file implies its directory, so a complete clone costs one stat per file;
+        # the directory is only looked at to report the outermost missing item
+        for directory, filename in expected_files:
+            item = os.path.join(repo_root, directory, filename)
+            if not os.path.isfile(item):
+                directory_path = os.path.join(repo_root, directory)
+                if not os.path.isdir(directory_path):
+                    item = directory_path
                 self.log_status(f"Missing expected repository item: {item}", "error")
                 return False
         return True
@@ -1160,10 +1535,11 @@ class BrainDriveInstaller(BaseInstaller):
                 if os.listdir(self.repo_path):
                     self.log_status("Installation directory already exists and is not empty.", "error")
                     return False
+                # Known to be empty: a single rmdir frees the name for the rename
                 PlatformUtils.ensure_writable(self.repo_path)
-                self._cleanup_directory(self.repo_path)
+                os.rmdir(self.repo_path)
 
-            shutil.move(staging_path, self.repo_path)
+            self._move_directory(staging_path, self.repo_path)
             return True
         except Exception as exc:
             self.logger.error(f"Failed to promote staging repository: {exc}")
@@ -1177,6 +1553,31 @@ class BrainDriveInstaller(BaseInstaller):
                 self.logger.error(f"Fallback copy of staging repository failed: {copy_exc}")
                 return False
 
+    def _move_directory(self, source, destination):
+        """
+        Move a directory tree into place with a single rename where possible.
+        
+        Args:
+            source: Directory to move
+            destination: New path; must not exist (or be an empty directory on POSIX)
+        """
+        for delay in _RENAME_RETRY_DELAYS + (None,):
+            try:
+                os.replace(source, destination)
+                return
+            except PermissionError:
+                # Antivirus and indexers briefly lock files in a freshly cloned tree on Windows
+                if delay is None or os.name != "nt":
+                    raise
+                self.logger.debug("Rename of %s blocked, retrying in %ss", source, delay)
+                time.sleep(delay)
+            except OSError as exc:
+                if exc.errno != errno.EXDEV:
+                    raise
+                # Different filesystem: shutil.move falls back to copying
+                shutil.move(source, destination)
+                return
+
     def _migrate_configuration(self, source_repo, target_repo):
         """Copy configuration artifacts from the existing install into the new repo."""
         files_to_copy = [
@@ -1221,16 +1622,16 @@ class BrainDriveInstaller(BaseInstaller):
         try:
             if os.path.exists(self.repo_path):
                 backup_path = self._create_backup_path()
-                shutil.move(self.repo_path, backup_path)
+                self._move_directory(self.repo_path, backup_path)
 
-            shutil.move(staging_path, self.repo_path)
+            self._move_directory(staging_path, self.repo_path)
             return True, backup_path
         except Exception as exc:
             self.logger.error(f"Failed to swap repository with staged clone: {exc}")
             # Attempt to restore previous installation if it was moved
             if backup_path and os.path.exists(backup_path) and not os.path.exists(self.repo_path):
                 try:
-                    shutil.move(backup_path, self.repo_path)
+                    self._move_directory(backup_path, self.repo_path)
                 except Exception as restore_error:
                     self.logger.error(f"Failed to restore backup after swap failure: {restore_error}")
             return False, backup_path
@@ -1243,7 +1644,7 @@ class BrainDriveInstaller(BaseInstaller):
         try:
             if os.path.exists(self.repo_path):
                 self._cleanup_directory(self.repo_path)
-            shutil.move(backup_path, self.repo_path)
+            self._move_directory(backup_path, self.repo_path)
         except Exception as exc:
             self.logger.error(f"Failed to restore backup repository: {exc}")
 
@@ -1254,87 +1655,116 @@ class BrainDriveInstaller(BaseInstaller):
 
     def _normalize_host_for_binding(self, host, allow_wildcard=False, default="localhost"):
         """Normalize host strings for process bindings."""
-        if not host:
-            return default
-        host = host.strip()
-        if "://" in host:
-            parsed = urlparse(host)
-            host = parsed.hostname or default
-        if allow_wildcard:
-            return host or default
-        if host in ("0.0.0.0", "*"):
-            return default
-        return host or default
+        return _normalize_binding_host(host, allow_wildcard, default)
 
     def _get_display_host(self, host):
         """Convert binding host into a user-friendly address."""
-        if not host:
-            return "localhost"
-        host = host.strip()
-        if "://" in host:
-            parsed = urlparse(host)
-            host = parsed.hostname or host
-        if host in ("0.0.0.0", "*"):
-            return "127.0.0.1"
-        return host
+        return _display_host(host)
 
     def _get_backend_health_host(self, host):
         """Return the host to probe when checking backend availability."""
-        display = self._get_display_host(host)
-        return display or "127.0.0.1"
+        return _display_host(host) or "127.0.0.1"
 
     def _build_service_url(self, host, port):
         """Build an HTTP URL suitable for logging/service links."""
-        display_host = self._get_display_host(host or "localhost")
-        port_part = f":{port}" if port else ""
-        return f"http://{display_host}{port_part}"
+        return _service_url(host, port)
 
     def _build_browser_url(self, host, port):
         """Build a browser-friendly URL accounting for schemes in settings."""
-        if not host:
-            host = "localhost"
-        host = host.strip()
-        if "://" in host:
-            parsed = urlparse(host)
-            browse_host = parsed.hostname or self._get_display_host(host)
-            scheme = parsed.scheme or "http"
-            effective_port = parsed.port or port
-            port_part = f":{effective_port}" if effective_port else ""
-            path = parsed.path or ""
-            return f"{scheme}://{browse_host}{port_part}{path}"
-
-        browse_host = self._get_display_host(host)
-        port_part = f":{port}" if port else ""
-        return f"http://{browse_host}{port_part}"
+        return _browser_url(host, port)
 
     def _wait_for_backend_ready(self, host, port, timeout=120):
         """Poll the backend until it responds or timeout elapses."""
+        # http.client and the email parser behind it take longer to import than the
+        # rest of this module; only starting the services needs them
+        import http.client
         endpoints = ["/health", "/api/health", "/status", "/docs", "/openapi.json", "/"]
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        executor = None
+        # Connect to the resolved address so reconnects skip the name lookup
+        address = _resolve_ipv4(host)
+        # One keep-alive connection per endpoint, reused across rounds; a round only
+        # starts after every probe of the previous one has finished
+        connections = {path: http.client.HTTPConnection(address, port, timeout=3) for path in endpoints}
+        futures = {}
 
-        while time.time() - start_time < timeout:
-            for path in endpoints:
-                url = f"http://{host}:{port}{path}"
+        try:
+            while time.monotonic() < deadline:
+                # Until uvicorn is listening a TCP connect is refused at once; only probe
+                # the HTTP endpoints once something accepts connections on the port
                 try:
-                    with urllib.request.urlopen(url, timeout=3) as response:
-                        if 200 <= response.status < 400:
-                            self.logger.info(f"Backend responded to probe at {url} (status {response.status})")
-                            return True
-                except urllib.error.URLError as exc:
-                    self.logger.debug(f"Backend probe failed for {url}: {exc}")
-                except Exception as exc:
-                    self.logger.debug(f"Backend probe encountered error for {url}: {exc}")
-            time.sleep(1)
+                    with socket.create_connection((address, port), timeout=0.1):
+                        pass
+                except OSError:
+                    time.sleep(0.1)
+                    continue
+
+                # The endpoint that answered last time usually answers again
+                ready_path = self._backend_ready_path
+                if ready_path in connections and self._probe_backend_path(connections[ready_path], ready_path, host):
+                    return True
+
+                # Otherwise probe every endpoint at once and take the first answer
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=len(endpoints))
+                futures = {
+                    executor.submit(self._probe_backend_path, connections[path], path, host): path
+                    for path in endpoints
+                }
+                for future in as_completed(futures):
+                    if future.result():
+                        self._backend_ready_path = futures[future]
+                        return True
+                # Listening but not answering yet, e.g. still running startup hooks
+                time.sleep(0.25)
+        finally:
+            if executor is not None:
+                # Don't wait for slower probes once one has answered
+                executor.shutdown(wait=False, cancel_futures=True)
+            in_flight = {path: future for future, path in futures.items() if not future.done()}
+            for path, conn in connections.items():
+                if path in in_flight:
+                    # A probe may still be using it; close it once that probe returns
+                    in_flight[path].add_done_callback(lambda _future, conn=conn: conn.close())
+                else:
+                    conn.close()
 
         self.logger.error(f"Backend did not respond on {host}:{port} within {timeout} seconds")
         return False
 
+    def _probe_backend_path(self, conn, path, host):
+        """Return True if the backend answers GET path with a 2xx/3xx status on conn."""
+        authority = f"{host}:{conn.port}"
+        # Probes repeat many times per start; debug messages are only formatted if enabled
+        try:
+            # GET rather than HEAD: FastAPI answers HEAD on GET-only routes with 405.
+            # Send the configured host name, which the backend's allowed hosts list
+            conn.request("GET", path, headers={"Host": authority})
+            response = conn.getresponse()
+            response.read()  # Drain the body so the connection can be reused
+            if 200 <= response.status < 400:
+                self.logger.info("Backend responded to probe at http://%s%s (status %s)", authority, path, response.status)
+                return True
+            self.logger.debug("Backend probe got status %s for http://%s%s", response.status, authority, path)
+        except OSError as exc:
+            self.logger.debug("Backend probe failed for http://%s%s: %s", authority, path, exc)
+            conn.close()  # Reconnects on the next request
+        except Exception as exc:
+            self.logger.debug("Backend probe encountered error for http://%s%s: %s", authority, path, exc)
+            conn.close()
+        return False
+
     def _refresh_paths(self):
         """Sync instance path attributes with the current AppConfig state."""
         self.repo_path = self.config.repo_path
         self.backend_path = self.config.backend_path
         self.frontend_path = self.config.frontend_path
         self.plugins_path = self.config.plugins_path
+        # Files the setup steps look for, joined once per path change
+        self.backend_requirements_path = os.path.join(self.backend_path, "requirements.txt")
+        self.backend_env_path = os.path.join(self.backend_path, ".env")
+        self.frontend_package_path = os.path.join(self.frontend_path, "package.json")
+        self.frontend_env_path = os.path.join(self.frontend_path, ".env")
         env_name = getattr(self, "env_name", "BrainDriveDev")
         self.env_prefix = PlatformUtils.join_paths(self.config.miniconda_path, "envs", env_name)
 
@@ -1353,6 +1783,11 @@ class BrainDriveInstaller(BaseInstaller):
 
         self.config.set_base_path(base_path)
         self._refresh_paths()
+        self._settings_manager = None
+        self._settings_cache_key = None
+        # The bundled conda lives under the base path
+        self._conda_cmd = None
+        self._conda_fallback = None
 
         if not InstallerState.set_install_path(self.config.base_path):
             self.logger.warning("Unable to persist install path to installer state.")
@@ -1368,12 +1803,8 @@ class BrainDriveInstaller(BaseInstaller):
         if not candidate_path or not isinstance(candidate_path, str):
             return
 
-        normalized_candidate = os.path.abspath(candidate_path)
-        if not os.path.isabs(normalized_candidate):
-            return
-
-        current_base = os.path.abspath(self.config.base_path)
-        if os.path.normcase(normalized_candidate) == os.path.normcase(current_base):
+        normalized_candidate, candidate_key = _normalize_path(candidate_path)
+        if candidate_key == _normalize_path(self.config.base_path)[1]:
             return
 
         expected_repo = os.path.join(normalized_candidate, "BrainDrive")
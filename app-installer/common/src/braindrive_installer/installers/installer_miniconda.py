@@ -1,22 +1,79 @@
+import glob
+import hashlib
+import http.client
 import os
 import platform
+import random
+import shutil
 import threading
-import urllib.request
+import time
 import subprocess
-import ssl
-try:
-    import certifi
-    SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
-except ImportError:
-    # Fallback: try system certificates, or disable verification as last resort
-    try:
-        SSL_CONTEXT = ssl.create_default_context()
-    except Exception:
-        SSL_CONTEXT = ssl._create_unverified_context()
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
 
 from braindrive_installer.core.base_installer import BaseInstaller
 from braindrive_installer.core.platform_utils import PlatformUtils
 from braindrive_installer.core.installer_logger import get_installer_logger
+from braindrive_installer.utils.http_session import get_http_session
+
+# Console-hiding flags are fixed per platform; resolve them once
+_NO_WINDOW_FLAGS = PlatformUtils.create_no_window_flags()
+# How long a check_installed result is reused
+_INSTALLED_CACHE_SECONDS = 2.0
+# Lines of command output kept to report when a command fails
+_OUTPUT_TAIL_LINES = 200
+# Bytes read from the network and written to disk per step of the installer download
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Pauses before each retry of an interrupted download; each retry resumes the .part file
+_DOWNLOAD_RETRY_DELAYS = (1, 2, 4, 8)
+# Connections used for a parallel download, and the least each one is given to fetch
+_MAX_DOWNLOAD_CONNECTIONS = 8
+_DOWNLOAD_SEGMENT_SIZE = 8 << 20
+# Byte ranges must index the file as stored, not a compressed transfer of it
+_DOWNLOAD_HEADERS = {'Accept-Encoding': 'identity'}
+# Connect and per-read timeouts; a stalled transfer fails and is resumed by a retry
+_DOWNLOAD_TIMEOUT = (15, 60)
+# Sidecar next to the installer recording the server's ETag/Last-Modified for it
+_VALIDATOR_SUFFIX = '.etag'
+# repo.anaconda.com publishes each installer's SHA-256 next to it under this suffix
+_CHECKSUM_SUFFIX = '.sha256'
+# The freshness check is a single short attempt; offline, the local installer is used at once
+_PROBE_TIMEOUT = (3, 5)
+
+
+def _response_validator(response):
+    """Return the ETag, or failing that the Last-Modified date, of a response."""
+    return response.headers.get('ETag') or response.headers.get('Last-Modified')
+
+
+def _read_validator(path):
+    """Return the validator stored in a sidecar file, or None if there is none."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _write_validator(path, validator):
+    """Store a validator in a sidecar file, removing the sidecar when there is none."""
+    if validator:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(validator)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def _discard_partial(part_path):
+    """Remove a partial download together with its validator sidecar."""
+    for path in (part_path, part_path + _VALIDATOR_SUFFIX):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
 
 class MinicondaInstaller(BaseInstaller):
     def __init__(self, status_updater=None):
@@ -48,6 +105,13 @@ class MinicondaInstaller(BaseInstaller):
                 self.miniconda_url = "https://repo.anaconda.com/miniconda/Miniconda3-latest-Linux-x86_64.sh"
         
         self.installer_path = PlatformUtils.join_paths(self.config.base_path, self.installer_filename)
+        # Last download percentage shown, so progress is only reported when it changes
+        self._download_percent = -1
+        # Last check_installed result and when it was taken
+        self._installed_cache = None
+        self._installed_checked_at = 0.0
+        # Trees left by a run that exited before its background delete finished
+        self._remove_in_background(glob.glob(glob.escape(self.miniconda_path) + '.trash-*'))
         
         self.logger.info(f"MinicondaInstaller initialized - OS: {os_type}, URL: {self.miniconda_url}")
         self.logger.info(f"Installer path: {self.installer_path}")
@@ -58,8 +122,14 @@ class MinicondaInstaller(BaseInstaller):
         """
         Check if Miniconda is installed by verifying the presence of conda.exe.
         """
+        # The installer, environment setup and UI all ask in quick succession
+        now = time.monotonic()
+        if self._installed_cache is not None and now - self._installed_checked_at < _INSTALLED_CACHE_SECONDS:
+            return self._installed_cache
         installed = os.path.exists(self.conda_exe)
         self.logger.info(f"Miniconda installation check: {installed} (checking {self.conda_exe})")
+        self._installed_cache = installed
+        self._installed_checked_at = now
         return installed
 
     def install(self):
@@ -69,6 +139,7 @@ class MinicondaInstaller(BaseInstaller):
         """
         self.logger.info("Starting Miniconda installation process")
         
+        self._installed_cache = None
         if self.check_installed():
             self.logger.info("Miniconda already installed, skipping installation")
             if self.status_updater:
@@ -88,8 +159,7 @@ class MinicondaInstaller(BaseInstaller):
             # Remove any existing miniconda directory - installer wants to create it fresh
             if os.path.exists(self.miniconda_path):
                 self.log_status(f"Removing existing Miniconda directory: {self.miniconda_path}")
-                import shutil
-                shutil.rmtree(self.miniconda_path)
+                self._discard_directory(self.miniconda_path)
             
             self.download_installer()
 
@@ -124,6 +194,7 @@ class MinicondaInstaller(BaseInstaller):
             self.run_command(install_cmd, capture_output=False)
             
             # Verify installation
+            self._installed_cache = None
             if self.check_installed():
                 if self.status_updater:
                     self.status_updater.update_status(
@@ -147,10 +218,336 @@ class MinicondaInstaller(BaseInstaller):
             raise Exception(error_msg)
 
 
+    def _report_download_progress(self, received, total):
+        """Show download progress whenever it crosses another whole percent."""
+        if not (total and self.status_updater):
+            return
+        percent = min(100, received * 100 // total)
+        if percent != self._download_percent:
+            self._download_percent = percent
+            # Download spans 10-30% of the Miniconda step
+            self.status_updater.update_status(
+                    "Step: [1/3] Downloading Miniconda...",
+                    f"Downloaded {received // (1 << 20)} of {total // (1 << 20)} MB ({percent}%)",
+                    10 + percent // 5,
+                )
+
+    def _stream_download(self, response, out_file, offset=0):
+        """
+        Copy a download to out_file in fixed-size chunks, reporting progress as it goes.
+
+        Args:
+            response: Streaming requests response to read from
+            out_file: Binary file object to write to
+            offset: Bytes already downloaded by an earlier attempt that this response resumes
+        """
+        length = int(response.headers.get('Content-Length') or 0)
+        total = offset + length if length else 0
+        received = offset
+        self._download_percent = -1
+        # Only one chunk is held in memory; the installer is over 100 MB
+        for chunk in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+            out_file.write(chunk)
+            received += len(chunk)
+            self._report_download_progress(received, total)
+        # A connection closed mid-body must not pass for a complete download
+        if length and received - offset < length:
+            raise http.client.IncompleteRead(b'', length - (received - offset))
+
+    def _download_in_parallel(self, parallel_path, size, validator):
+        """
+        Download the installer over several connections, each fetching one byte range.
+
+        The file is assembled under its own name: until every range has landed it is
+        full length with gaps, which the .part resume logic must never mistake for a
+        prefix of the installer.
+
+        Args:
+            parallel_path: File to assemble the download in
+            size: Size of the installer, from the freshness check's HEAD response
+            validator: The installer's ETag or Last-Modified value, from the same response
+
+        Returns:
+            True if parallel_path holds the complete installer, False if the caller
+            should download it over a single connection instead
+        """
+        segments = min(_MAX_DOWNLOAD_CONNECTIONS, -(-size // _DOWNLOAD_SEGMENT_SIZE))
+        if segments < 2:
+            return False
+
+        session = get_http_session()
+        # Contiguous ranges, one per connection; the last one takes the remainder
+        step = size // segments
+        ranges = [(i * step, size - 1 if i == segments - 1 else (i + 1) * step - 1) for i in range(segments)]
+        lock = threading.Lock()
+        failed = threading.Event()
+        received = [0]
+        self._download_percent = -1
+
+        def fetch(first, last):
+            # If-Range makes a server that has replaced the file answer 200 instead
+            headers = {**_DOWNLOAD_HEADERS, 'Range': f'bytes={first}-{last}', 'If-Range': validator}
+            with session.get(self.miniconda_url, headers=headers, stream=True, timeout=_DOWNLOAD_TIMEOUT) as response:
+                content_range = response.headers.get('Content-Range') or ''
+                if response.status_code != 206 or content_range != f'bytes {first}-{last}/{size}':
+                    raise ValueError(f"server did not return range {first}-{last}/{size} (HTTP {response.status_code})")
+                # Each connection writes through its own handle at its own offsets
+                with open(parallel_path, 'r+b') as out_file:
+                    out_file.seek(first)
+                    position = first
+                    for chunk in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                        if failed.is_set():
+                            return
+                        out_file.write(chunk)
+                        position += len(chunk)
+                        with lock:
+                            received[0] += len(chunk)
+                            self._report_download_progress(received[0], size)
+                    if position <= last:
+                        raise http.client.IncompleteRead(b'', last + 1 - position)
+
+        self.log_status(f"Downloading {size} bytes over {segments} connections")
+        try:
+            # Reserve the full size up front so every range has somewhere to land
+            with open(parallel_path, 'wb') as out_file:
+                out_file.truncate(size)
+            with ThreadPoolExecutor(max_workers=segments) as executor:
+                futures = [executor.submit(fetch, first, last) for first, last in ranges]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception:
+                        failed.set()  # Stop the other connections at their next chunk
+                        raise
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            self.log_status(f"Parallel download failed ({e}); using a single connection", "warning")
+            try:
+                os.remove(parallel_path)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def _download_with_resume(self, expected_size=None, expected_validator=None, accepts_ranges=False):
+        """
+        Download the installer through a .part file, resuming it after interruptions.
+
+        The installer only appears under its final name once complete, so a partial
+        download is never mistaken for a finished one. The .part file keeps the
+        validator of the response that started it, and a resume sends it as If-Range:
+        should the server have a new build by then, it answers with the whole new file
+        rather than splicing its tail onto the old bytes.
+
+        Args:
+            expected_size: Size of the installer as reported by the server, if known
+            expected_validator: The installer's ETag or Last-Modified value, if known
+            accepts_ranges: Whether the server advertised byte range support
+
+        Returns:
+            The ETag or Last-Modified value the server sent with the download, or None
+        """
+        part_path = self.installer_path + ".part"
+        part_validator_path = part_path + _VALIDATOR_SUFFIX
+        parallel_path = self.installer_path + ".parallel"
+        # A parallel download interrupted by the process exiting cannot be resumed
+        _discard_partial(parallel_path)
+        # A fresh download can be split across connections; a .part left by an
+        # interrupted single-connection download is resumed instead. Ranges from
+        # different builds must not mix, so this needs a validator to send as If-Range
+        if (not os.path.exists(part_path) and accepts_ranges and expected_size and expected_validator
+                and self._download_in_parallel(parallel_path, expected_size, expected_validator)):
+            os.replace(parallel_path, self.installer_path)
+            return expected_validator
+
+        # Retries reuse the session's pooled connection, skipping a new TLS handshake
+        session = get_http_session()
+        for attempt in range(len(_DOWNLOAD_RETRY_DELAYS) + 1):
+            resume_from = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            part_validator = _read_validator(part_validator_path) if resume_from else None
+            if resume_from and not part_validator:
+                # No telling which build these bytes belong to; start over
+                _discard_partial(part_path)
+                resume_from = 0
+            headers = _DOWNLOAD_HEADERS
+            if resume_from:
+                headers = {**_DOWNLOAD_HEADERS, 'Range': f'bytes={resume_from}-', 'If-Range': part_validator}
+            try:
+                with session.get(self.miniconda_url, headers=headers, stream=True, timeout=_DOWNLOAD_TIMEOUT) as response:
+                    if response.status_code == 416 and resume_from:
+                        # The partial file is not a prefix the server can continue; start over
+                        _discard_partial(part_path)
+                        continue
+                    response.raise_for_status()
+                    content_range = response.headers.get('Content-Range') or ''
+                    resuming = response.status_code == 206 and content_range.startswith(f'bytes {resume_from}-')
+                    if resuming and expected_size and not content_range.endswith(f'/{expected_size}'):
+                        # The rest of some other file than the one the server described
+                        _discard_partial(part_path)
+                        continue
+                    if resume_from and not resuming:
+                        if response.status_code == 206:
+                            # Some other range came back; start over rather than append it
+                            _discard_partial(part_path)
+                            continue
+                        self.log_status("Cannot resume the previous download; restarting it", "warning")
+                    elif resuming:
+                        self.log_status(f"Resuming Miniconda download at {resume_from} bytes")
+                    if resuming:
+                        validator = part_validator
+                    else:
+                        # Recorded before any bytes land, so an interrupted download can resume
+                        validator = _response_validator(response)
+                        _write_validator(part_validator_path, validator)
+                    with open(part_path, 'ab' if resuming else 'wb') as out_file:
+                        self._stream_download(response, out_file, resume_from if resuming else 0)
+                os.replace(part_path, self.installer_path)
+                _write_validator(part_validator_path, None)
+                return validator
+            except (OSError, http.client.HTTPException) as e:
+                # requests' exceptions are OSErrors, including HTTP error statuses
+                if attempt == len(_DOWNLOAD_RETRY_DELAYS):
+                    raise
+                error = e
+            # Jitter keeps many installers on one flaky network from retrying in lockstep
+            delay = _DOWNLOAD_RETRY_DELAYS[attempt] * random.uniform(1.0, 1.5)
+            self.log_status(f"Download interrupted ({error}); retrying in {delay:.1f}s", "warning")
+            time.sleep(delay)
+        raise Exception("Download kept restarting; giving up")
+
+    def _discard_directory(self, path):
+        """
+        Move a directory out of the way and delete it in the background.
+
+        Renaming is a single metadata operation, so the caller can reuse the path
+        immediately while the old tree is unlinked on a daemon thread. If the rename
+        fails (e.g. a file inside is locked on Windows), the tree is removed in place.
+
+        Args:
+            path: Directory to remove
+        """
+        trash_path = f"{path}.trash-{os.getpid()}"
+        try:
+            if os.path.exists(trash_path):
+                shutil.rmtree(trash_path, ignore_errors=True)
+            os.rename(path, trash_path)
+        except OSError as e:
+            self.logger.info(f"Could not move {path} aside ({e}); removing it in place")
+            shutil.rmtree(path)
+            return
+        self._remove_in_background([trash_path])
+
+    @staticmethod
+    def _remove_in_background(paths):
+        """
+        Delete directory trees on a daemon thread.
+
+        The thread dies with the process, so an interrupted delete leaves a partial
+        tree behind; __init__ sweeps those up on the next run.
+
+        Args:
+            paths: Directories to remove
+        """
+        if not paths:
+            return
+
+        def _remove_all():
+            for path in paths:
+                shutil.rmtree(path, ignore_errors=True)
+
+        threading.Thread(target=_remove_all, daemon=True).start()
+
+    def _fetch_installer_validator(self):
+        """
+        Ask the server which version of the installer it currently serves.
+
+        Returns:
+            tuple: (ETag or Last-Modified value, Content-Length, whether byte ranges
+            are accepted); the first two are None when the server does not send them
+            or cannot be reached
+        """
+        try:
+            # Not the shared session: its retries would hold up an offline install
+            response = requests.head(
+                self.miniconda_url, headers=_DOWNLOAD_HEADERS, allow_redirects=True, timeout=_PROBE_TIMEOUT
+            )
+            response.raise_for_status()
+        except OSError as e:
+            self.logger.info(f"Could not check the installer on the server: {e}")
+            return None, None, False
+        validator = _response_validator(response)
+        content_length = response.headers.get('Content-Length')
+        accepts_ranges = (response.headers.get('Accept-Ranges') or '').lower() == 'bytes'
+        return validator, int(content_length) if content_length and content_length.isdigit() else None, accepts_ranges
+
+    def _installer_is_current(self, validator, remote_size):
+        """
+        Check whether the downloaded installer matches what the server serves.
+
+        Args:
+            validator: ETag or Last-Modified value the server reports, or None
+            remote_size: Content-Length the server reports, or None
+
+        Returns:
+            bool: False if the installer is known to differ from the server's copy
+        """
+        if validator is None:
+            # Offline, or a server without validators: nothing to compare against
+            return True
+        if _read_validator(self.installer_path + _VALIDATOR_SUFFIX) != validator:
+            return False
+        return remote_size is None or os.path.getsize(self.installer_path) == remote_size
+
+    def _fetch_published_sha256(self):
+        """
+        Fetch the SHA-256 the server publishes for the installer.
+
+        Returns:
+            The digest as lowercase hex, or None if the server does not publish one
+        """
+        try:
+            with get_http_session().get(self.miniconda_url + _CHECKSUM_SUFFIX, timeout=_DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                digest = response.text.split()[0].lower() if response.text.strip() else ''
+        except OSError as e:
+            self.logger.info(f"No published checksum for the Miniconda installer: {e}")
+            return None
+        if len(digest) != 64 or any(c not in '0123456789abcdef' for c in digest):
+            self.logger.info("Published checksum for the Miniconda installer is not a SHA-256 digest")
+            return None
+        return digest
+
+    def _verify_download(self):
+        """
+        Check the downloaded installer against its published SHA-256.
+
+        Resumed and parallel downloads are assembled from several responses, so the
+        complete file is hashed once at the end. A mismatch removes the installer,
+        so the next attempt downloads it afresh instead of running a corrupt one.
+        """
+        expected = self._fetch_published_sha256()
+        if expected is None:
+            return
+        digest = hashlib.sha256()
+        with open(self.installer_path, 'rb') as installer_file:
+            while chunk := installer_file.read(_DOWNLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+        if digest.hexdigest() != expected:
+            os.remove(self.installer_path)
+            _write_validator(self.installer_path + _VALIDATOR_SUFFIX, None)
+            raise Exception(f"Checksum mismatch for Miniconda installer: expected {expected}, got {digest.hexdigest()}")
+        self.log_status("Miniconda installer checksum verified")
+
     def download_installer(self):
         """
         Download the Miniconda installer.
         """
+        validator, remote_size, accepts_ranges = self._fetch_installer_validator()
+        validator_path = self.installer_path + _VALIDATOR_SUFFIX
+        if os.path.exists(self.installer_path) and not self._installer_is_current(validator, remote_size):
+            self.log_status("Existing Miniconda installer is out of date or incomplete; downloading it again")
+            os.remove(self.installer_path)
+            _write_validator(validator_path, None)
+
         if not os.path.exists(self.installer_path):
             try:
                 if self.status_updater:
@@ -162,15 +559,15 @@ class MinicondaInstaller(BaseInstaller):
                 self.log_status(f"Downloading Miniconda from: {self.miniconda_url}")
                 self.log_status(f"Saving to: {self.installer_path}")
                 
-                # Use SSL context with certifi certificates for macOS compatibility
-                with urllib.request.urlopen(self.miniconda_url, context=SSL_CONTEXT) as response:
-                    with open(self.installer_path, 'wb') as out_file:
-                        out_file.write(response.read())
+                # The validator recorded is the one sent with the bytes actually saved
+                validator = self._download_with_resume(remote_size, validator, accepts_ranges)
                 
                 # Verify download
                 if os.path.exists(self.installer_path):
                     file_size = os.path.getsize(self.installer_path)
                     self.log_status(f"Download completed. File size: {file_size} bytes")
+                    self._verify_download()
+                    _write_validator(validator_path, validator)
                     if self.status_updater:
                         self.status_updater.update_status(
                                 "Step: [1/3] Download Complete.",
@@ -252,6 +649,7 @@ class MinicondaInstaller(BaseInstaller):
         """
         Update Conda to the latest version.
         """
+        self._installed_cache = None
         if not self.check_installed():
             raise RuntimeError(f"{self.name} is not installed. Please install it first.")
 
@@ -272,7 +670,7 @@ class MinicondaInstaller(BaseInstaller):
         :param cmd_list: List of command and arguments to run.
         :param cwd: Directory to execute the command in.
         :param capture_output: Whether to capture and return stdout and stderr.
-        :return: The process's stdout and stderr as a tuple (stdout, stderr).
+        :return: The last lines of the process's stdout and stderr as a tuple (stdout, stderr).
         :raises: subprocess.CalledProcessError if the command fails.
         """
         try:
@@ -280,25 +678,45 @@ class MinicondaInstaller(BaseInstaller):
             self.log_status(f"Running command: {command_str}")
 
             # Get cross-platform process creation flags
-            process_flags = PlatformUtils.create_no_window_flags()
+            process_flags = _NO_WINDOW_FLAGS
 
             process = subprocess.Popen(
                 cmd_list,
                 stdout=subprocess.PIPE if capture_output else None,
                 stderr=subprocess.PIPE if capture_output else None,
                 text=True,
+                bufsize=1,  # Line buffered, so output is reported as it is produced
                 cwd=cwd,
-                env=os.environ.copy(),  # Ensure environment variables are inherited
+                # env left unset: the child inherits this process's environment without a copy
                 **process_flags  # Apply platform-specific flags
             )
 
-            stdout, stderr = process.communicate()
-
-            # Log output if capture_output is True
-            if stdout:
-                self.log_status(f"Command output: {stdout}")
-            if stderr:
-                self.log_status(f"Command stderr: {stderr}", "warning")
+            stdout = stderr = None
+            if capture_output:
+                # Report each line as it arrives and keep only the tail for errors;
+                # conda can print megabytes while solving and installing
+                stdout_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+                stderr_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+
+                def drain_stderr():
+                    for line in process.stderr:
+                        line = line.rstrip()
+                        if line:
+                            stderr_tail.append(line)
+                            self.log_status(f"Command stderr: {line}", "warning")
+
+                # stderr gets its own reader so a full pipe cannot stall the child
+                stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
+                stderr_thread.start()
+                for line in process.stdout:
+                    line = line.rstrip()
+                    if line:
+                        stdout_tail.append(line)
+                        self.log_status(f"Command output: {line}")
+                stderr_thread.join()
+                stdout = "\n".join(stdout_tail)
+                stderr = "\n".join(stderr_tail)
+            process.wait()
 
             # Check for errors and raise if process failed
             if process.returncode != 0:
@@ -3,8 +3,8 @@ import shutil
 import sys
 from pathlib import Path
 
-import requests
 from braindrive_installer.config.AppConfig import AppConfig
+from braindrive_installer.utils.http_session import get_http_session
 
 # Optional Windows-only imports
 IS_WINDOWS = sys.platform == "win32"
@@ -60,7 +60,7 @@ class AppDesktopIntegration:
         try:
             if not os.path.exists(self.exe_path):
                 print("Executable not found. Downloading...")
-                response = requests.get(self.repo_url, stream=True)
+                response = get_http_session().get(self.repo_url, stream=True)
                 if response.status_code == 200:
                     with open(self.exe_path, "wb") as exe_file:
                         shutil.copyfileobj(response.raw, exe_file)
@@ -24,9 +24,10 @@ HERO_ICON_IMAGE = None
 # Update check deps
 import json
 import time
-import requests
 from packaging.version import Version
 
+from braindrive_installer.utils.http_session import get_http_session
+
 try:
     import importlib.resources as pkg_resources  # Python 3.9+
 except Exception:  # pragma: no cover - fallback for older
@@ -501,7 +502,7 @@ def _get_latest_release_version() -> str:
         owner_repo = "/".join(parts[-2:]) if len(parts) >= 2 else "BrainDriveAI/BrainDrive-Install-System"
         url = f"https://api.github.com/repos/{owner_repo}/releases/latest"
     try:
-        resp = requests.get(url, timeout=15)
+        resp = get_http_session().get(url, timeout=15)
         resp.raise_for_status()
         data = resp.json()
         return str(data.get("tag_name") or "")
@@ -13,6 +13,7 @@ from braindrive_installer.core.port_selector import (
     DEFAULT_PORT_PAIRS,
     select_available_port_pair,
 )
+from braindrive_installer.utils.env_template import fill_template
 
 class BrainDriveSettingsManager:
     """Manages BrainDrive configuration settings with JSON persistence and template generation."""
@@ -339,20 +340,18 @@ class BrainDriveSettingsManager:
             wrote_frontend = False
 
             if backend_tpl:
-                for k, v in variables.items():
-                    backend_tpl = backend_tpl.replace(f'{{{k}}}', str(v))
+                backend_tpl = fill_template(backend_tpl, variables)
                 backend_dir.mkdir(parents=True, exist_ok=True)
-                backend_env.write_text(backend_tpl, encoding='utf-8')
+                backend_env.write_text(backend_tpl, encoding='utf-8', newline='\n')
                 wrote_backend = True
                 logger.info(f"Created backend .env from template: {backend_env}")
             else:
                 logger.warning(f"Backend template not used; {backend_err}. Falling back to repo examples/synthesis.")
 
             if frontend_tpl:
-                for k, v in variables.items():
-                    frontend_tpl = frontend_tpl.replace(f'{{{k}}}', str(v))
+                frontend_tpl = fill_template(frontend_tpl, variables)
                 frontend_dir.mkdir(parents=True, exist_ok=True)
-                frontend_env.write_text(frontend_tpl, encoding='utf-8')
+                frontend_env.write_text(frontend_tpl, encoding='utf-8', newline='\n')
                 wrote_frontend = True
                 logger.info(f"Created frontend .env from template: {frontend_env}")
             else:
@@ -360,9 +359,10 @@ class BrainDriveSettingsManager:
 
             # Fallback copy if templates missing/unreadable
             if not wrote_backend:
+                backend_dir.mkdir(parents=True, exist_ok=True)
                 backend_dev = backend_dir / '.env-dev'
                 if backend_dev.exists():
-                    backend_env.write_text(backend_dev.read_text(encoding='utf-8'), encoding='utf-8')
+                    backend_env.write_text(backend_dev.read_text(encoding='utf-8'), encoding='utf-8', newline='\n')
                     logger.info(f"Created backend .env by copying .env-dev: {backend_env}")
                 else:
                     # Minimal synthesized backend env
@@ -374,13 +374,14 @@ class BrainDriveSettingsManager:
                         f"SECRET_KEY=\"{variables['SECRET_KEY']}\"\n"
                         f"ENCRYPTION_MASTER_KEY=\"{variables['ENCRYPTION_MASTER_KEY']}\"\n"
                     )
-                    backend_env.write_text(backend_content, encoding='utf-8')
+                    backend_env.write_text(backend_content, encoding='utf-8', newline='\n')
                     logger.info(f"Created backend .env by synthesizing from settings: {backend_env}")
 
             if not wrote_frontend:
+                frontend_dir.mkdir(parents=True, exist_ok=True)
                 frontend_example = frontend_dir / '.env.example'
                 if frontend_example.exists():
-                    frontend_env.write_text(frontend_example.read_text(encoding='utf-8'), encoding='utf-8')
+                    frontend_env.write_text(frontend_example.read_text(encoding='utf-8'), encoding='utf-8', newline='\n')
                     logger.info(f"Created frontend .env by copying .env.example: {frontend_env}")
                 else:
                     logger.warning("frontend/.env.example not found; synthesizing frontend .env from settings.")
@@ -390,7 +391,7 @@ class BrainDriveSettingsManager:
                         f"VITE_DEV_SERVER_PORT={variables['FRONTEND_PORT']}\n"
                         f"VITE_DEV_SERVER_HOST={variables['FRONTEND_HOST']}\n"
                     )
-                    frontend_env.write_text(frontend_content, encoding='utf-8')
+                    frontend_env.write_text(frontend_content, encoding='utf-8', newline='\n')
                     logger.info(f"Created frontend .env by synthesizing from settings: {frontend_env}")
 
             return True
@@ -444,6 +445,10 @@ class BrainDriveSettingsManager:
             "127.0.0.1"
         ]
 
+        # Drop duplicates but keep first-seen order so regenerated .env files are stable
+        cors_origins = list(dict.fromkeys(cors_origins))
+        allowed_hosts = list(dict.fromkeys(allowed_hosts))
+
         existing_secret_key = self._get_existing_env_value(self.backend_env_file, "SECRET_KEY")
         secret_key = existing_secret_key or secrets.token_urlsafe(32)
 
@@ -470,8 +475,8 @@ class BrainDriveSettingsManager:
             'MAX_UPLOAD_SIZE': str(self.get_setting('performance', 'max_upload_size_mb') * 1000000),
             'DATABASE_PATH': self.get_setting('advanced', 'database_path'),
             'LOG_LEVEL': self.get_setting('advanced', 'log_level'),
-            'CORS_ORIGINS': str(list(set(cors_origins))).replace("'", '"'),
-            'ALLOWED_HOSTS': str(list(set(allowed_hosts))).replace("'", '"')
+            'CORS_ORIGINS': json.dumps(cors_origins),
+            'ALLOWED_HOSTS': json.dumps(allowed_hosts)
         }
     
     def load_from_env_files(self) -> bool:
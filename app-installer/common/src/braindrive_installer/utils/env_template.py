@@ -0,0 +1,20 @@
+import re
+from typing import Mapping
+
+
+# {NAME} placeholders used by the packaged .env templates
+_PLACEHOLDER_RE = re.compile(r"\{([A-Z0-9_]+)\}")
+
+
+def fill_template(template: str, values: Mapping[str, object]) -> str:
+    """
+    Substitute {NAME} placeholders in a single pass over the template.
+
+    Placeholders without a value are left as they are. Substituted values are
+    not scanned again, so a value containing braces is written verbatim.
+    """
+    def _replace(match):
+        name = match.group(1)
+        return str(values[name]) if name in values else match.group(0)
+
+    return _PLACEHOLDER_RE.sub(_replace, template)
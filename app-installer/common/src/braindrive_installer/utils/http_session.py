@@ -0,0 +1,42 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Large enough for every connection of a parallel download to be kept alive
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 8
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the installer's shared HTTP session.
+
+    Connections are kept alive and pooled per host, so repeated requests to the same
+    server (retries, range requests, follow-up downloads) skip the TCP and TLS
+    handshakes. Transient gateway errors are retried with backoff before a response
+    is returned.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=("HEAD", "GET"),
+            )
+            adapter = HTTPAdapter(
+                pool_connections=_POOL_CONNECTIONS,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=retry,
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
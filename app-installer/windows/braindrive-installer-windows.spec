@@ -108,6 +108,7 @@ package_modules = [
     'installers.installer_pipelines',
     'installers.cleanup_braindrive',
     'installers.cleanup_processes',
+    'installers._process_cleanup',
     'installers.create_braindrive_image',
     'installers.create_version_info',
     'ui.base_card',
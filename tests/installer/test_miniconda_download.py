@@ -0,0 +1,242 @@
+import hashlib
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SRC_ROOT = REPO_ROOT / "app-installer" / "common" / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from braindrive_installer.core.platform_utils import PlatformUtils
+from braindrive_installer.installers import installer_miniconda
+from braindrive_installer.installers.installer_miniconda import MinicondaInstaller
+
+OLD_BUILD = bytes(range(256)) * 256
+NEW_BUILD = bytes(reversed(range(256))) * 256
+
+
+class _InstallerServer(ThreadingHTTPServer):
+    """Serves one installer file with an ETag, honouring Range and If-Range like a CDN."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _InstallerHandler)
+        self.body = OLD_BUILD
+        self.etag = '"v1"'
+        self.honor_range = True
+        self.cut_next_get_at = None  # Drop the connection after this many body bytes, once
+        self.checksum = None  # Contents of the published .sha256 file; None answers 404
+        self.requests = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}/Miniconda3-latest.sh"
+
+
+class _InstallerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.server.requests.append(("HEAD", dict(self.headers)))
+        self._send_headers(200, len(self.server.body))
+
+    def do_GET(self):
+        server = self.server
+        if self.path.endswith(".sha256"):
+            self._send_checksum()
+            return
+        server.requests.append(("GET", dict(self.headers)))
+        body = server.body
+        status, first, last = 200, 0, len(body) - 1
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if server.honor_range and range_header and (if_range is None or if_range == server.etag):
+            start, _, end = range_header.split("=")[1].partition("-")
+            first, last = int(start), min(int(end or last), last)
+            if first >= len(body):
+                self._send_headers(416, 0, {"Content-Range": f"bytes */{len(body)}"})
+                return
+            status = 206
+        payload = body[first:last + 1]
+        extra = {"Content-Range": f"bytes {first}-{last}/{len(body)}"} if status == 206 else {}
+        self._send_headers(status, len(payload), extra)
+        if server.cut_next_get_at is not None:
+            payload = payload[:server.cut_next_get_at]
+            server.cut_next_get_at = None
+            self.close_connection = True
+        self.wfile.write(payload)
+
+    def _send_checksum(self):
+        checksum = self.server.checksum
+        if checksum is None:
+            self.send_error(404)
+            return
+        payload = checksum.encode("ascii")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_headers(self, status, length, extra=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("ETag", self.server.etag)
+        if self.server.honor_range:
+            self.send_header("Accept-Ranges", "bytes")
+        for name, value in (extra or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+
+@pytest.fixture
+def server():
+    httpd = _InstallerServer()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def installer(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(PlatformUtils, "get_executable_directory", lambda: str(tmp_path))
+    monkeypatch.setattr(installer_miniconda, "_DOWNLOAD_RETRY_DELAYS", (0, 0, 0, 0))
+    miniconda = MinicondaInstaller()
+    miniconda.miniconda_url = server.url
+    miniconda.installer_path = str(tmp_path / "MinicondaInstaller.sh")
+    return miniconda
+
+
+def _write_partial(installer, data, validator):
+    part_path = Path(installer.installer_path + ".part")
+    part_path.write_bytes(data)
+    Path(str(part_path) + ".etag").write_text(validator, encoding="utf-8")
+    return part_path
+
+
+def _gets(server):
+    return [headers for method, headers in server.requests if method == "GET"]
+
+
+def test_interrupted_download_resumes_where_it_stopped(installer, server, monkeypatch):
+    monkeypatch.setattr(installer_miniconda, "_DOWNLOAD_CHUNK_SIZE", 1000)
+    server.cut_next_get_at = 10000
+
+    installer.download_installer()
+
+    assert Path(installer.installer_path).read_bytes() == OLD_BUILD
+    resumed = _gets(server)[1]
+    assert 0 < int(resumed["Range"][len("bytes="):-1]) <= 10000
+    assert resumed["If-Range"] == '"v1"'
+    assert not Path(installer.installer_path + ".part").exists()
+    assert Path(installer.installer_path + ".etag").read_text(encoding="utf-8") == '"v1"'
+
+
+def test_partial_left_by_earlier_run_is_resumed(installer, server):
+    _write_partial(installer, OLD_BUILD[:5000], '"v1"')
+
+    installer.download_installer()
+
+    assert Path(installer.installer_path).read_bytes() == OLD_BUILD
+    assert [headers["Range"] for headers in _gets(server)] == ["bytes=5000-"]
+
+
+def test_server_ignoring_range_restarts_download(installer, server):
+    server.honor_range = False
+    _write_partial(installer, OLD_BUILD[:5000], '"v1"')
+
+    installer.download_installer()
+
+    assert Path(installer.installer_path).read_bytes() == OLD_BUILD
+
+
+def test_stale_partial_is_discarded_on_416(installer, server):
+    _write_partial(installer, OLD_BUILD + b"extra", '"v1"')
+
+    installer.download_installer()
+
+    assert Path(installer.installer_path).read_bytes() == OLD_BUILD
+    assert [headers.get("Range") for headers in _gets(server)] == [f"bytes={len(OLD_BUILD) + 5}-", None]
+
+
+def test_partial_of_a_replaced_build_is_not_spliced(installer, server):
+    _write_partial(installer, OLD_BUILD[:5000], '"v1"')
+    server.body, server.etag = NEW_BUILD, '"v2"'
+
+    installer.download_installer()
+
+    # Same size as the old build, so only the validator can tell them apart
+    assert Path(installer.installer_path).read_bytes() == NEW_BUILD
+    assert Path(installer.installer_path + ".etag").read_text(encoding="utf-8") == '"v2"'
+
+
+def test_current_installer_is_not_downloaded_again(installer, server):
+    installer.download_installer()
+    server.requests.clear()
+
+    installer.download_installer()
+
+    assert [method for method, _ in server.requests] == ["HEAD"]
+
+
+def test_installer_replaced_on_server_is_downloaded_again(installer, server):
+    installer.download_installer()
+    server.body, server.etag = NEW_BUILD, '"v2"'
+
+    installer.download_installer()
+
+    assert Path(installer.installer_path).read_bytes() == NEW_BUILD
+    assert Path(installer.installer_path + ".etag").read_text(encoding="utf-8") == '"v2"'
+
+
+def test_parallel_download_reuses_probe_and_leaves_no_partial(installer, server, monkeypatch):
+    monkeypatch.setattr(installer_miniconda, "_DOWNLOAD_SEGMENT_SIZE", 8192)
+    # Left full length with gaps by a run that was killed mid-download
+    Path(installer.installer_path + ".parallel").write_bytes(bytes(len(OLD_BUILD)))
+
+    installer.download_installer()
+
+    assert Path(installer.installer_path).read_bytes() == OLD_BUILD
+    assert [method for method, _ in server.requests].count("HEAD") == 1
+    gets = _gets(server)
+    assert len(gets) == installer_miniconda._MAX_DOWNLOAD_CONNECTIONS
+    assert all(headers["If-Range"] == '"v1"' for headers in gets)
+    assert not Path(installer.installer_path + ".parallel").exists()
+    assert not Path(installer.installer_path + ".part").exists()
+
+
+def test_partial_without_validator_is_not_resumed(installer, server):
+    # Full length but mostly zeros, as a parallel download used to leave it
+    Path(installer.installer_path + ".part").write_bytes(bytes(len(OLD_BUILD)))
+
+    installer.download_installer()
+
+    assert Path(installer.installer_path).read_bytes() == OLD_BUILD
+    assert [headers.get("Range") for headers in _gets(server)] == [None]
+
+
+def test_download_matching_published_checksum_is_kept(installer, server):
+    server.checksum = f"{hashlib.sha256(OLD_BUILD).hexdigest()}  Miniconda3-latest.sh\n"
+
+    installer.download_installer()
+
+    assert Path(installer.installer_path).read_bytes() == OLD_BUILD
+
+
+def test_download_not_matching_published_checksum_is_removed(installer, server):
+    server.checksum = hashlib.sha256(NEW_BUILD).hexdigest()
+
+    with pytest.raises(Exception, match="Checksum mismatch"):
+        installer.download_installer()
+
+    assert not Path(installer.installer_path).exists()
+    assert not Path(installer.installer_path + ".etag").exists()
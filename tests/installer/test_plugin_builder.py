@@ -0,0 +1,99 @@
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SRC_ROOT = REPO_ROOT / "app-installer" / "common" / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from braindrive_installer.core.plugin_builder import PluginBuilder
+
+
+def _make_plugin(root: Path, name: str, build_dirs=(), with_modules=True) -> Path:
+    plugin_dir = root / name
+    plugin_dir.mkdir(parents=True)
+    package = {"name": name, "version": "1.0.0", "scripts": {"build": "webpack"}}
+    (plugin_dir / "package.json").write_text(json.dumps(package), encoding="utf-8")
+    if with_modules:
+        (plugin_dir / "node_modules" / "dep").mkdir(parents=True)
+    for build_dir in build_dirs:
+        (plugin_dir / build_dir).mkdir()
+        (plugin_dir / build_dir / "index.js").write_text("", encoding="utf-8")
+    return plugin_dir
+
+
+def test_check_plugin_built_reports_artifacts_in_order(tmp_path):
+    plugin_dir = _make_plugin(tmp_path, "alpha", build_dirs=("out", "dist"))
+    (plugin_dir / "build").mkdir()  # empty build dirs are not artifacts
+    (plugin_dir / "lib").write_text("not a directory", encoding="utf-8")
+
+    is_built, build_info = PluginBuilder(str(tmp_path)).check_plugin_built(str(plugin_dir))
+
+    assert is_built
+    assert build_info["build_artifacts"] == ["dist", "out"]
+    assert build_info["has_dist"]
+    assert not build_info["has_build"]
+
+
+def test_check_plugin_built_requires_node_modules(tmp_path):
+    plugin_dir = _make_plugin(tmp_path, "beta", build_dirs=("dist",), with_modules=False)
+
+    is_built, build_info = PluginBuilder(str(tmp_path)).check_plugin_built(str(plugin_dir))
+
+    assert not is_built
+    assert not build_info["has_node_modules"]
+    assert build_info["build_artifacts"] == ["dist"]
+
+
+def test_discover_plugins_skips_non_plugin_entries(tmp_path):
+    _make_plugin(tmp_path, "alpha")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+    (tmp_path / "empty-dir").mkdir()
+
+    success, plugins = PluginBuilder(str(tmp_path)).discover_plugins()
+
+    assert success
+    assert [plugin["directory_name"] for plugin in plugins] == ["alpha"]
+    assert plugins[0]["path"] == str(tmp_path / "alpha")
+
+
+def test_build_all_plugins_skips_plugins_built_during_discovery(tmp_path, monkeypatch):
+    _make_plugin(tmp_path, "alpha", build_dirs=("dist",))
+    builder = PluginBuilder(str(tmp_path))
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("already built plugins should not be rebuilt")
+
+    calls = []
+    original_check = builder.check_plugin_built
+    monkeypatch.setattr(builder, "check_plugin_built", lambda path: calls.append(path) or original_check(path))
+    monkeypatch.setattr(builder, "build_plugin", _fail)
+
+    success, results = builder.build_all_plugins()
+
+    assert success
+    assert results["plugins_skipped"] == 1
+    assert results["build_details"]["alpha"]["status"] == "skipped"
+    assert calls == [str(tmp_path / "alpha")]
+
+
+def test_build_all_plugins_parallel_collects_every_result(tmp_path, monkeypatch):
+    for name in ("alpha", "beta", "gamma"):
+        _make_plugin(tmp_path, name)
+    builder = PluginBuilder(str(tmp_path))
+    monkeypatch.setattr("braindrive_installer.core.plugin_builder.os.cpu_count", lambda: 4)
+
+    def _build(path, force_clean, package_info):
+        if package_info["name"] == "beta":
+            return False, "boom"
+        return True, ""
+
+    monkeypatch.setattr(builder, "build_plugin", _build)
+
+    success, results = builder.build_all_plugins(parallel=True)
+
+    assert not success
+    assert results["plugins_built"] == 2
+    assert results["failed_plugins"] == ["beta"]
+    assert results["build_details"]["beta"] == {"status": "failed", "error": "boom", "path": str(tmp_path / "beta")}
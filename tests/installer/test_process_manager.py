@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import psutil
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SRC_ROOT = REPO_ROOT / "app-installer" / "common" / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from braindrive_installer.core.process_manager import ProcessManager
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="process groups are POSIX only")
+
+
+def _start_group(manager: ProcessManager, tmp_path: Path, name: str, ignore_term: bool = False) -> int:
+    """Start a shell that spawns a sleeping child, returning the child's pid."""
+    pid_file = tmp_path / f"{name}.child"
+    # An ignored signal stays ignored in the children, so the whole group needs SIGKILL
+    trap = 'trap "" TERM; ' if ignore_term else ""
+    script = f'{trap}sleep 60 & echo $! > "{pid_file}"; wait'
+    success, error = manager.start_process(name, ["sh", "-c", script])
+    assert success, error
+
+    deadline = time.monotonic() + 5
+    while not pid_file.exists() or not pid_file.read_text().strip():
+        assert time.monotonic() < deadline, "child never started"
+        time.sleep(0.01)
+    return int(pid_file.read_text())
+
+
+def _gone(pid: int) -> bool:
+    try:
+        # Orphans are reaped by init, which may lag; a zombie no longer runs
+        return psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return True
+
+
+def test_stop_process_kills_group_and_reaps_leader(tmp_path):
+    manager = ProcessManager(log_dir=str(tmp_path))
+    child_pid = _start_group(manager, tmp_path, "server")
+    leader = manager.processes["server"]["process"]
+
+    started = time.monotonic()
+    success, _ = manager.stop_process("server", graceful_timeout=5)
+
+    assert success
+    assert time.monotonic() - started < 5
+    assert leader.poll() is not None
+    assert _gone(child_pid)
+    assert "server" not in manager.processes
+
+
+def test_stop_all_processes_shares_one_timeout(tmp_path):
+    manager = ProcessManager(log_dir=str(tmp_path))
+    names = ("backend", "frontend", "plugins")
+    child_pids = [_start_group(manager, tmp_path, name, ignore_term=True) for name in names]
+    leaders = [info["process"] for info in manager.processes.values()]
+
+    started = time.monotonic()
+    success, results = manager.stop_all_processes(graceful_timeout=2)
+    elapsed = time.monotonic() - started
+
+    assert success
+    assert results["processes_stopped"] == 3
+    # Every group ignores SIGTERM, so the full timeout runs out once; waiting for the
+    # groups in turn would take at least 6 seconds
+    assert 2 <= elapsed < 6
+    assert all(leader.poll() is not None for leader in leaders)
+    assert all(_gone(pid) for pid in child_pids)
+    assert manager.processes == {}
@@ -90,6 +90,28 @@ def test_settings_manager_uses_shared_data_dir(monkeypatch, tmp_path):
     assert Path(manager.settings_file).parent == data_dir
 
 
+def test_regenerate_env_files_fills_templates(monkeypatch, tmp_path):
+    _mock_os_type(monkeypatch, "windows")
+    _mock_home(monkeypatch, tmp_path / "home")
+
+    exe_dir = tmp_path / "portable-settings"
+    exe_dir.mkdir()
+    monkeypatch.setattr(PlatformUtils, "get_executable_directory", lambda: str(exe_dir))
+
+    install_root = tmp_path / "install-root"
+    install_root.mkdir()
+
+    manager = BrainDriveSettingsManager(str(install_root))
+    assert manager.regenerate_env_files()
+
+    backend_env = (install_root / "backend" / ".env").read_bytes().decode("utf-8")
+    port = manager.get_setting("network", "backend_port")
+    assert f"PORT={port}\n" in backend_env
+    assert "{" not in backend_env.split("CORS_ORIGINS=")[0]
+    assert "\r\n" not in backend_env
+    assert (install_root / "frontend" / ".env").exists()
+
+
 def test_sync_installer_bundle_copies_bundle_and_state(monkeypatch, tmp_path):
     _mock_os_type(monkeypatch, "windows")
     _mock_home(monkeypatch, tmp_path / "home")